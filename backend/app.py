@@ -6,7 +6,7 @@ import os
 import sys
 import time
 import logging
-from flask import Flask, jsonify, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
 from flask_cors import CORS
 import logging
 
@@ -43,17 +43,47 @@ def create_app(config_class=Config):
     from routes.analyze import analyze_bp
     app.register_blueprint(analyze_bp)
 
-    @app.route('/api/audio/<filename>')
-    def serve_audio(filename):
-        """TTS 오디오 파일 서빙"""
-        # 보안: 경로 조작 방지 (flask.send_from_directory가 기본적으로 처리하지만 한번 더)
-        return send_from_directory(Config.UPLOAD_FOLDER, filename)
+    @app.route('/api/audio/<audio_id>')
+    def serve_audio(audio_id):
+        """TTS 오디오 서빙 (메모리 저장소 → 디스크 spill 순)"""
+        from services.audio_store import AudioStore
+
+        entry = AudioStore.get(audio_id)
+        if entry is None:
+            spilled = AudioStore.spilled_path(audio_id)
+            if spilled is None:
+                return jsonify({
+                    'success': False,
+                    'error': {'code': 'NOT_FOUND', 'message': '오디오를 찾을 수 없습니다.'},
+                }), 404
+            # send_from_directory가 ETag / Range 처리
+            return send_from_directory(
+                os.path.dirname(spilled), os.path.basename(spilled),
+                mimetype='audio/mpeg', max_age=config_class.AUDIO_STORE_TTL,
+            )
+
+        if not entry.complete:
+            # 합성 중: 도착하는 청크를 바로 전달 (chunked transfer)
+            response = Response(AudioStore.stream(audio_id), mimetype=entry.mimetype)
+            response.headers['Cache-Control'] = 'no-store'
+            return response
+
+        # 완료 시 합쳐 둔 payload를 그대로 사용 (Range 요청마다 다시 합치지 않음)
+        data = entry.payload
+        response = Response(data, mimetype=entry.mimetype)
+        response.set_etag(entry.etag)
+        response.cache_control.private = True
+        response.cache_control.max_age = entry.expires_in()
+        # If-None-Match → 304, Range → 206 처리
+        return response.make_conditional(request, accept_ranges=True, complete_length=len(data))
 
     @app.route('/api/health', methods=['GET'])
     def health_check():
         """서버 상태 확인 엔드포인트"""
         from services.whisper_service import WhisperService
         from services.ollama_service import OllamaService
+        from services.cancellation import PipelineCancellation
+        from services.audio_store import AudioStore
 
         whisper_status = 'loaded' if WhisperService.is_loaded() else 'not_loaded'
         ollama_status = 'connected' if OllamaService.is_connected() else 'disconnected'
@@ -66,6 +96,9 @@ def create_app(config_class=Config):
                 'ollama': ollama_status,
             },
             'uptime': uptime,
+            'cancellation': PipelineCancellation.stats(),
+            'emotion': OllamaService.emotion_stats(),
+            'audio_store': AudioStore.stats(),
         })
 
     @app.errorhandler(400)
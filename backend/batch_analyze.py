@@ -0,0 +1,246 @@
+"""
+Batch Analyze CLI
+오디오 디렉터리 → STT → 감정 분석 일괄 처리 (JSONL 출력)
+
+사용 예:
+    python batch_analyze.py recordings/ -o results.jsonl --workers 4 --llm-concurrency 2
+
+- Whisper STT는 프로세스 풀에서 실행 (워커당 모델 1개 로드)
+- Ollama 감정 분석은 동시 요청 수를 제한한 스레드 풀에서 실행
+- 결과는 처리되는 즉시 JSONL로 기록, 재실행 시 이미 처리된 파일은 건너뜀
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSIONS = {'.webm', '.wav', '.mp3', '.m4a', '.ogg', '.flac'}
+
+
+def find_audio_files(input_dir: str) -> list:
+    """디렉터리를 재귀 탐색하여 오디오 파일 상대 경로 목록 반환 (정렬됨)"""
+    files = []
+    for root, _, names in os.walk(input_dir):
+        for name in names:
+            if os.path.splitext(name)[1].lower() in AUDIO_EXTENSIONS:
+                path = os.path.join(root, name)
+                files.append(os.path.relpath(path, input_dir).replace(os.sep, '/'))
+    return sorted(files)
+
+
+def load_processed(output_path: str) -> set:
+    """
+    기존 JSONL 결과에서 성공적으로 처리된 파일 목록을 읽습니다.
+    에러로 기록된 파일은 재시도 대상이므로 제외합니다.
+    """
+    processed = set()
+    if not os.path.exists(output_path):
+        return processed
+
+    with open(output_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # 중단 시 마지막 줄이 잘렸을 수 있음
+                continue
+            if isinstance(record, dict) and 'file' in record and 'error' not in record:
+                processed.add(record['file'])
+    return processed
+
+
+def repair_trailing_line(output_path: str):
+    """
+    중단된 실행이 남긴 잘린 마지막 줄을 제거합니다.
+    그대로 이어쓰면 첫 새 레코드가 잘린 줄에 붙어 파싱할 수 없게 됩니다.
+    """
+    if not os.path.exists(output_path):
+        return
+
+    with open(output_path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b'\n':
+            return
+
+        # 마지막 줄바꿈 위치를 뒤에서부터 찾아 그 뒤를 잘라냄
+        pos = size
+        block = 4096
+        while pos > 0:
+            start = max(0, pos - block)
+            f.seek(start)
+            index = f.read(pos - start).rfind(b'\n')
+            if index >= 0:
+                f.truncate(start + index + 1)
+                break
+            pos = start
+        else:
+            f.truncate(0)
+    logger.warning(f'잘린 마지막 줄 제거: {output_path}')
+
+
+def _init_worker():
+    """프로세스 풀 워커 초기화: Whisper 모델 1회 로드"""
+    logging.basicConfig(level=logging.WARNING)
+    from services.whisper_service import WhisperService
+    WhisperService._load_model()
+
+
+def _transcribe_file(input_dir: str, rel_path: str, profile: str = None) -> dict:
+    """(워커 프로세스) 오디오 변환 + Whisper STT"""
+    from services.audio_converter import AudioConverter
+    from services.whisper_service import WhisperService
+
+    start = time.time()
+    src = os.path.join(input_dir, rel_path)
+    if not AudioConverter.validate_audio(src):
+        raise RuntimeError('유효하지 않은 오디오 파일')
+
+    if src.lower().endswith('.wav'):
+        stt_result = WhisperService.transcribe(src, profile=profile)
+    else:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            wav_path = os.path.join(tmp_dir, 'input.wav')
+            AudioConverter.convert_webm_to_wav(src, wav_path)
+            stt_result = WhisperService.transcribe(wav_path, profile=profile)
+
+    stt_result['stt_time'] = round(time.time() - start, 2)
+    return stt_result
+
+
+def _analyze_emotion(stt_result: dict) -> dict:
+    """
+    (메인 프로세스 스레드) Ollama 감정 분석
+    LLM 실패는 예외로 올려 에러 레코드로 남김 (기본값 neutral을 성공으로 기록하면 재실행 시 재시도되지 않음)
+    """
+    from services.ollama_service import OllamaService
+
+    start = time.time()
+    text = stt_result.get('text', '')
+    if text:
+        emotion_result = OllamaService.analyze_emotion(text, raise_on_error=True)
+    else:
+        emotion_result = {'emotion': 'neutral', 'intensity': 0.0, 'state': 'listening', 'keywords': []}
+    emotion_result['llm_time'] = round(time.time() - start, 2)
+    return emotion_result
+
+
+def run_batch(input_dir: str, output_path: str, workers: int = None,
+              llm_concurrency: int = None, profile: str = None) -> dict:
+    """
+    디렉터리 내 오디오 파일을 일괄 분석합니다.
+
+    Args:
+        input_dir: 오디오 파일 디렉터리
+        output_path: JSONL 결과 파일 경로 (이어쓰기)
+        workers: Whisper 프로세스 수
+        llm_concurrency: 동시 Ollama 요청 수
+        profile: Whisper 디코딩 프로파일 (기본: Config.WHISPER_PROFILE)
+
+    Returns:
+        {"total": 10, "skipped": 3, "processed": 6, "failed": 1, "elapsed": 42.1, "files_per_minute": 8.55}
+    """
+    workers = workers or Config.BATCH_WORKERS
+    llm_concurrency = llm_concurrency or Config.BATCH_LLM_CONCURRENCY
+
+    all_files = find_audio_files(input_dir)
+    repair_trailing_line(output_path)
+    processed = load_processed(output_path)
+    pending = [f for f in all_files if f not in processed]
+    stats = {
+        'total': len(all_files),
+        'skipped': len(all_files) - len(pending),
+        'processed': 0,
+        'failed': 0,
+    }
+    logger.info(f'오디오 {stats["total"]}개 중 {stats["skipped"]}개 처리됨, {len(pending)}개 분석 시작')
+
+    start_time = time.time()
+    write_lock = threading.Lock()
+
+    with open(output_path, 'a', encoding='utf-8') as out:
+        def write_record(record: dict, failed: bool):
+            with write_lock:
+                out.write(json.dumps(record, ensure_ascii=False) + '\n')
+                out.flush()
+                stats['failed' if failed else 'processed'] += 1
+
+        def analyze_and_write(rel_path: str, stt_result: dict):
+            try:
+                emotion_result = _analyze_emotion(stt_result)
+                write_record({'file': rel_path, **stt_result, **emotion_result}, failed=False)
+            except Exception as e:
+                logger.error(f'감정 분석 실패 ({rel_path}): {e}')
+                write_record({'file': rel_path, 'error': str(e)}, failed=True)
+
+        if pending:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as stt_pool, \
+                    ThreadPoolExecutor(max_workers=llm_concurrency) as llm_pool:
+                stt_futures = {
+                    stt_pool.submit(_transcribe_file, input_dir, rel_path, profile): rel_path
+                    for rel_path in pending
+                }
+                llm_futures = []
+                for future in as_completed(stt_futures):
+                    rel_path = stt_futures[future]
+                    try:
+                        stt_result = future.result()
+                    except Exception as e:
+                        logger.error(f'STT 실패 ({rel_path}): {e}')
+                        write_record({'file': rel_path, 'error': str(e)}, failed=True)
+                        continue
+                    llm_futures.append(llm_pool.submit(analyze_and_write, rel_path, stt_result))
+
+                for future in llm_futures:
+                    future.result()
+
+    elapsed = time.time() - start_time
+    stats['elapsed'] = round(elapsed, 2)
+    stats['files_per_minute'] = round(stats['processed'] / elapsed * 60, 2) if elapsed > 0 else 0.0
+    return stats
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='오디오 디렉터리 일괄 STT → 감정 분석 (JSONL 출력)')
+    parser.add_argument('input_dir', help='오디오 파일 디렉터리 (하위 폴더 포함)')
+    parser.add_argument('-o', '--output', default='batch_results.jsonl', help='JSONL 결과 파일 (기본: batch_results.jsonl)')
+    parser.add_argument('--workers', type=int, default=Config.BATCH_WORKERS, help='Whisper 프로세스 수')
+    parser.add_argument('--llm-concurrency', type=int, default=Config.BATCH_LLM_CONCURRENCY, help='동시 Ollama 요청 수')
+    parser.add_argument('--profile', choices=sorted(Config.WHISPER_PROFILES), default=None,
+                        help=f'Whisper 디코딩 프로파일 (기본: {Config.WHISPER_PROFILE})')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        stream=sys.stdout,
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+    )
+
+    if not os.path.isdir(args.input_dir):
+        logger.error(f'디렉터리를 찾을 수 없습니다: {args.input_dir}')
+        return 1
+
+    stats = run_batch(args.input_dir, args.output, args.workers, args.llm_concurrency, args.profile)
+
+    logger.info('=' * 50)
+    logger.info(f'전체: {stats["total"]} / 건너뜀: {stats["skipped"]} / '
+                f'처리: {stats["processed"]} / 실패: {stats["failed"]}')
+    logger.info(f'소요 시간: {stats["elapsed"]}초 / 처리량: {stats["files_per_minute"]} files/min')
+    logger.info('=' * 50)
+    return 0 if stats['failed'] == 0 else 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Whisper Load Benchmark
+모델 로드 시간 (원본 체크포인트 / mmap 캐시 cold / warm) 및 프로세스별 메모리 측정
+
+사용 예:
+    python bench_whisper_load.py --processes 3
+
+각 측정은 별도 프로세스에서 실행됩니다 (모듈 캐시 영향 제거).
+mmap 측정인데 실제로 캐시에서 로드하지 못했으면 (원본 체크포인트로 폴백) 실패로 처리합니다.
+PSS(공유 페이지를 프로세스 수로 나눈 값)는 Linux에서만 측정됩니다.
+"""
+import os
+import sys
+import json
+import glob
+import time
+import argparse
+import subprocess
+
+from config import Config
+
+
+def memory_usage_mb() -> dict:
+    """현재 프로세스의 RSS / PSS (MB, 측정 불가 시 None)"""
+    rss = pss = None
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                if line.startswith('Rss:'):
+                    rss = int(line.split()[1]) / 1024
+                elif line.startswith('Pss:'):
+                    pss = int(line.split()[1]) / 1024
+    except OSError:
+        try:
+            import psutil
+            rss = psutil.Process().memory_info().rss / (1024 * 1024)
+        except ImportError:
+            pass
+    return {
+        'rss_mb': round(rss, 1) if rss is not None else None,
+        'pss_mb': round(pss, 1) if pss is not None else None,
+    }
+
+
+def _child(hold: bool):
+    """(하위 프로세스) 모델 로드 후 결과를 JSON 한 줄로 출력"""
+    from services.whisper_service import WhisperService
+
+    start = time.perf_counter()
+    WhisperService._load_model()
+    load_time = time.perf_counter() - start
+    print(json.dumps({
+        'load_seconds': round(load_time, 2),
+        'source': WhisperService.load_source(),
+        **memory_usage_mb(),
+    }), flush=True)
+
+    if hold:
+        # 다른 프로세스가 모두 로드될 때까지 대기 후 메모리 재측정 (페이지 공유 확인)
+        sys.stdin.readline()
+        print(json.dumps(memory_usage_mb()), flush=True)
+
+
+def _spawn(mmap_cache: bool, hold: bool = False) -> subprocess.Popen:
+    env = dict(os.environ, WHISPER_MMAP_CACHE='1' if mmap_cache else '0')
+    args = [sys.executable, os.path.abspath(__file__), '--child']
+    if hold:
+        args.append('--hold')
+    return subprocess.Popen(
+        args, env=env, cwd=os.path.dirname(os.path.abspath(__file__)),
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+    )
+
+
+def _check_source(label: str, row: dict, expected: tuple):
+    """측정 행이 기대한 경로로 로드되었는지 확인 (mmap 폴백 시 잘못된 수치 방지)"""
+    if row.get('source') not in expected:
+        raise RuntimeError(f'{label}: {" / ".join(expected)}에서 로드되지 않았습니다 (source={row.get("source")})')
+
+
+def _run_once(mmap_cache: bool) -> dict:
+    proc = _spawn(mmap_cache)
+    out, _ = proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError('모델 로드 프로세스 실패')
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _run_concurrent(mmap_cache: bool, processes: int) -> list:
+    """여러 프로세스를 동시에 띄워 모두 로드된 상태의 메모리 측정"""
+    procs = [_spawn(mmap_cache, hold=True) for _ in range(processes)]
+    loaded = []
+    for proc in procs:
+        line = proc.stdout.readline()  # 로드 완료 대기
+        if not line:
+            raise RuntimeError('모델 로드 프로세스 실패')
+        loaded.append(json.loads(line))
+    results = []
+    for proc, row in zip(procs, loaded):
+        proc.stdin.write('measure\n')
+        proc.stdin.flush()
+        results.append({'source': row['source'], **json.loads(proc.stdout.readline())})
+    for proc in procs:
+        proc.stdin.close()
+        proc.wait()
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Whisper 모델 로드 시간 / 메모리 벤치마크')
+    parser.add_argument('--processes', type=int, default=2, help='동시 프로세스 수 (메모리 공유 측정)')
+    parser.add_argument('--keep-cache', action='store_true', help='cold 측정 전에 mmap 캐시를 지우지 않음')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--hold', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.hold)
+        return 0
+
+    if not args.keep_cache:
+        for path in glob.glob(os.path.join(Config.WHISPER_CACHE_DIR, '*.pt')):
+            os.unlink(path)
+
+    # (라벨, mmap 사용, 허용 source)
+    runs = [
+        ('checkpoint', False, ('checkpoint',)),
+        ('mmap cold', True, ('mmap-cache', 'mmap-cache (built)') if args.keep_cache else ('mmap-cache (built)',)),
+        ('mmap warm', True, ('mmap-cache',)),
+    ]
+    try:
+        rows = []
+        for label, mmap_cache, expected in runs:
+            row = _run_once(mmap_cache)
+            _check_source(label, row, expected)
+            rows.append((label, row))
+    except RuntimeError as e:
+        print(f'벤치마크 실패: {e}')
+        return 1
+
+    print('=' * 70)
+    print(f'Whisper 모델: {Config.WHISPER_MODEL}')
+    print('-' * 70)
+    print(f'{"load":<14}{"time(s)":>10}{"RSS(MB)":>12}{"PSS(MB)":>12}  source')
+    for label, row in rows:
+        print(f'{label:<14}{row["load_seconds"]:>10.2f}{str(row["rss_mb"]):>12}{str(row["pss_mb"]):>12}'
+              f'  {row["source"]}')
+
+    if args.processes > 1:
+        print('-' * 70)
+        print(f'동시 {args.processes}개 프로세스 (프로세스별 평균)')
+        for label, mmap_cache, expected in (runs[0], runs[2]):
+            results = _run_concurrent(mmap_cache, args.processes)
+            try:
+                for row in results:
+                    _check_source(label, row, expected)
+            except RuntimeError as e:
+                print(f'벤치마크 실패: {e}')
+                return 1
+            rss = [r['rss_mb'] for r in results if r['rss_mb'] is not None]
+            pss = [r['pss_mb'] for r in results if r['pss_mb'] is not None]
+            avg_rss = round(sum(rss) / len(rss), 1) if rss else None
+            avg_pss = round(sum(pss) / len(pss), 1) if pss else None
+            print(f'{label:<14}{"":>10}{str(avg_rss):>12}{str(avg_pss):>12}  {expected[0]}')
+    print('=' * 70)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Whisper Profile Benchmark
+디코딩 프로파일별 지연 시간 / 인식 결과 일치도 측정
+
+사용 예:
+    python bench_whisper_profiles.py testset/ --repeat 3
+
+- testset/ 아래 오디오 파일마다 같은 이름의 .txt 파일이 있으면 정답 전사로 사용
+- 없으면 'accurate' 프로파일 결과를 기준으로 일치도 계산
+"""
+import os
+import sys
+import re
+import time
+import argparse
+import statistics
+from difflib import SequenceMatcher
+
+from config import Config
+from batch_analyze import find_audio_files
+
+REFERENCE_PROFILE = 'accurate'
+
+
+def normalize_text(text: str) -> str:
+    """공백/문장부호 제거 (문자 단위 비교용)"""
+    return re.sub(r'[\s\W_]+', '', text or '').lower()
+
+
+def agreement(hypothesis: str, reference: str) -> float:
+    """문자 단위 일치도 (0.0 ~ 1.0, 1 - CER 근사)"""
+    hyp, ref = normalize_text(hypothesis), normalize_text(reference)
+    if not hyp and not ref:
+        return 1.0
+    return SequenceMatcher(None, hyp, ref).ratio()
+
+
+def load_references(test_dir: str, files: list) -> dict:
+    """오디오 파일별 정답 전사(.txt) 로드"""
+    references = {}
+    for rel_path in files:
+        txt_path = os.path.join(test_dir, os.path.splitext(rel_path)[0] + '.txt')
+        if os.path.exists(txt_path):
+            with open(txt_path, encoding='utf-8') as f:
+                references[rel_path] = f.read().strip()
+    return references
+
+
+def run_benchmark(test_dir: str, profiles: list, repeat: int = 1) -> dict:
+    """
+    프로파일별로 테스트셋 전체를 전사하여 지연 시간과 일치도를 측정합니다.
+
+    Returns:
+        {"realtime": {"latency_mean": 0.41, "latency_p95": 0.52, "agreement": 0.93, "files": 20}, ...}
+    """
+    from services.whisper_service import WhisperService
+
+    files = find_audio_files(test_dir)
+    if not files:
+        raise RuntimeError(f'오디오 파일이 없습니다: {test_dir}')
+
+    references = load_references(test_dir, files)
+    if len(references) < len(files) and REFERENCE_PROFILE not in profiles:
+        profiles = profiles + [REFERENCE_PROFILE]
+
+    # 모델 로드 및 워밍업 (첫 추론 비용 제외)
+    WhisperService._load_model()
+    WhisperService.transcribe(os.path.join(test_dir, files[0]), profile=profiles[0])
+
+    transcripts = {p: {} for p in profiles}
+    latencies = {p: [] for p in profiles}
+    for profile in profiles:
+        for rel_path in files:
+            path = os.path.join(test_dir, rel_path)
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = WhisperService.transcribe(path, profile=profile)
+                latencies[profile].append(time.perf_counter() - start)
+            transcripts[profile][rel_path] = result['text']
+
+    report = {}
+    for profile in profiles:
+        scores = []
+        for rel_path in files:
+            reference = references.get(rel_path, transcripts.get(REFERENCE_PROFILE, {}).get(rel_path, ''))
+            scores.append(agreement(transcripts[profile][rel_path], reference))
+        samples = sorted(latencies[profile])
+        report[profile] = {
+            'latency_mean': round(statistics.mean(samples), 3),
+            'latency_p95': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+            'agreement': round(statistics.mean(scores), 3),
+            'files': len(files),
+        }
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Whisper 디코딩 프로파일 벤치마크')
+    parser.add_argument('test_dir', help='테스트 오디오 디렉터리 (선택: 같은 이름의 .txt 정답 전사)')
+    parser.add_argument('--profiles', nargs='+', choices=sorted(Config.WHISPER_PROFILES),
+                        default=list(Config.WHISPER_PROFILES), help='측정할 프로파일')
+    parser.add_argument('--repeat', type=int, default=1, help='파일당 반복 횟수')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.test_dir):
+        print(f'디렉터리를 찾을 수 없습니다: {args.test_dir}')
+        return 1
+
+    report = run_benchmark(args.test_dir, list(args.profiles), args.repeat)
+
+    print('=' * 60)
+    print(f'Whisper 모델: {Config.WHISPER_MODEL} / 기준: .txt 정답 또는 {REFERENCE_PROFILE}')
+    print('-' * 60)
+    print(f'{"profile":<12}{"mean(s)":>10}{"p95(s)":>10}{"agreement":>12}{"files":>8}')
+    for profile, row in report.items():
+        print(f'{profile:<12}{row["latency_mean"]:>10.3f}{row["latency_p95"]:>10.3f}'
+              f'{row["agreement"]:>12.3f}{row["files"]:>8}')
+    print('=' * 60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,8 +4,59 @@ import os
 
 class Config:
     WHISPER_MODEL = os.environ.get('WHISPER_MODEL', 'small')
+    # 변환된 가중치를 mmap으로 로드 (프로세스 간 페이지 공유, 빠른 재시작)
+    WHISPER_MMAP_CACHE = os.environ.get('WHISPER_MMAP_CACHE', '1') == '1'
+    WHISPER_CACHE_DIR = os.environ.get(
+        'WHISPER_CACHE_DIR', os.path.join(os.path.dirname(__file__), 'model_cache')
+    )
     OLLAMA_MODEL = os.environ.get('OLLAMA_MODEL', 'llama3:8b')
     OLLAMA_HOST = os.environ.get('OLLAMA_HOST', 'http://localhost:11434')
     MAX_AUDIO_SIZE = 10 * 1024 * 1024  # 10MB
     UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), 'temp_audio')
     OLLAMA_TIMEOUT = 10  # seconds
+
+    # TTS 오디오 메모리 저장소
+    AUDIO_STORE_TTL = 300                       # seconds
+    AUDIO_STORE_MAX_BYTES = 64 * 1024 * 1024    # 64MB
+    AUDIO_SPILL_TO_DISK = os.environ.get('AUDIO_SPILL_TO_DISK', '0') == '1'  # 용량 초과 시 UPLOAD_FOLDER로 이동
+    TTS_STREAM_TIMEOUT = 30                     # seconds, 합성 중 청크 대기 시간
+
+    # 감정 분석 빠른 경로 (로컬 키워드 사전 → 확신도가 낮을 때만 LLM 호출)
+    EMOTION_FASTPATH_THRESHOLD = float(os.environ.get('EMOTION_FASTPATH_THRESHOLD', 0.6))
+    EMOTION_CACHE_SIZE = 512
+    EMOTION_AUDIT_RATE = float(os.environ.get('EMOTION_AUDIT_RATE', 0.02))  # 빠른 경로 결과를 LLM과 비교할 샘플 비율
+
+    # Whisper 디코딩 프로파일 (요청별로 'profile' 필드로 선택 가능)
+    # single_window: 30초 이하 클립은 transcribe 루프 없이 단일 윈도우로 한 번만 디코딩
+    # no_speech_threshold / logprob_threshold: 무음 판정 (transcribe 기본값과 동일, 단일 윈도우에도 적용)
+    WHISPER_PROFILE = os.environ.get('WHISPER_PROFILE', 'realtime')
+    WHISPER_PROFILES = {
+        # 짧은 대화용: greedy, 온도 폴백 없음, 이전 문맥 조건 없음, 타임스탬프 생략
+        'realtime': {
+            'temperature': 0.0,
+            'condition_on_previous_text': False,
+            'without_timestamps': True,
+            'no_speech_threshold': 0.6,
+            'logprob_threshold': -1.0,
+            'single_window': True,
+        },
+        # greedy + 제한된 온도 폴백
+        'balanced': {
+            'temperature': (0.0, 0.4, 0.8),
+            'best_of': 2,
+            'condition_on_previous_text': False,
+            'single_window': False,
+        },
+        # 라이브러리 기본 폴백 + 빔 서치
+        'accurate': {
+            'temperature': (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+            'beam_size': 5,
+            'best_of': 5,
+            'condition_on_previous_text': True,
+            'single_window': False,
+        },
+    }
+
+    # 배치(오프라인) 분석
+    BATCH_WORKERS = int(os.environ.get('BATCH_WORKERS', max(1, (os.cpu_count() or 2) // 2)))
+    BATCH_LLM_CONCURRENCY = int(os.environ.get('BATCH_LLM_CONCURRENCY', 2))
@@ -5,9 +5,11 @@ Analyze Route - /api/analyze
 import os
 import time
 import logging
+import uuid
 import tempfile
 from flask import Blueprint, request, jsonify
 from config import Config
+from services.cancellation import PipelineCancellation, PipelineCancelled, make_disconnect_check
 
 logger = logging.getLogger(__name__)
 analyze_bp = Blueprint('analyze', __name__)
@@ -33,8 +35,27 @@ def analyze():
             'error': {'code': 'INVALID_AUDIO', 'message': '오디오 파일이 너무 큽니다. (최대 10MB)'},
         }), 400
 
+    # Whisper 디코딩 프로파일 (선택, 기본값: Config.WHISPER_PROFILE)
+    profile = request.form.get('profile') or None
+    if profile and profile not in Config.WHISPER_PROFILES:
+        return jsonify({
+            'success': False,
+            'error': {
+                'code': 'INVALID_PROFILE',
+                'message': f'알 수 없는 프로파일입니다. ({", ".join(Config.WHISPER_PROFILES)})',
+            },
+        }), 400
+
     temp_webm = None
     temp_wav = None
+    tts_started = False  # True면 토큰 해제를 TTS 합성 스레드가 담당
+
+    # 취소 토큰 등록 (요청/세션 ID는 클라이언트가 지정, 없으면 생성)
+    request_id = request.headers.get('X-Request-Id') or request.form.get('requestId') or uuid.uuid4().hex
+    session_id = request.headers.get('X-Session-Id') or request.form.get('sessionId')
+    cancel_token = PipelineCancellation.register(
+        request_id, session_id, make_disconnect_check(request.environ)
+    )
 
     try:
         # 2. 임시 파일로 저장
@@ -47,17 +68,20 @@ def analyze():
         logger.info(f'오디오 수신: {os.path.getsize(temp_webm.name)} bytes')
 
         # 3. webm → wav 변환
+        cancel_token.begin_stage('convert')
         from services.audio_converter import AudioConverter
         temp_wav_path = temp_webm.name.replace('.webm', '.wav')
         AudioConverter.convert_webm_to_wav(temp_webm.name, temp_wav_path)
         temp_wav = temp_wav_path
 
         # 4. Whisper STT
+        cancel_token.begin_stage('stt')
         from services.whisper_service import WhisperService
-        stt_result = WhisperService.transcribe(temp_wav)
+        stt_result = WhisperService.transcribe(temp_wav, profile=profile)
         text = stt_result.get('text', '').strip()
 
         if not text:
+            cancel_token.end_stage()
             return jsonify({
                 'success': True,
                 'data': {
@@ -71,42 +95,48 @@ def analyze():
                     'confidence': 0.0,
                     'language': 'ko',
                 },
+                'requestId': request_id,
                 'processing_time': round(time.time() - start_time, 2),
             })
 
         logger.info(f'STT 결과: "{text}"')
 
         # 5. Ollama 감정 분석 & 대화 생성
+        cancel_token.begin_stage('emotion')
         from services.ollama_service import OllamaService
-        emotion_result = OllamaService.analyze_emotion(text)
+        emotion_result = OllamaService.analyze_emotion(text, cancel_token=cancel_token)
         
         # AI 답변 생성 (Chat)
+        cancel_token.begin_stage('response')
         ai_response_text = OllamaService.generate_response(
             text, 
-            emotion=emotion_result.get('emotion', 'neutral')
+            emotion=emotion_result.get('emotion', 'neutral'),
+            cancel_token=cancel_token,
         )
 
-        # 6. TTS 음성 합성
+        # 6. TTS 음성 합성 (백그라운드 시작, 합성 중에도 /api/audio/<id>로 스트리밍 재생 가능)
+        cancel_token.begin_stage('tts')
         from services.tts_service import TtsService
         # 텍스트가 있을 때만 TTS 생성
-        audio_filename = ""
+        audio_id = ""
         if ai_response_text:
-            audio_filename = TtsService.generate_audio(ai_response_text)
+            # 합성은 응답 후에도 이어지므로 연결 종료는 취소로 보지 않고 (세션/요청 취소만 반영),
+            # 단계 시간 기록과 토큰 해제는 합성 스레드가 완료 시 처리
+            cancel_token.detach_disconnect()
+            audio_id = TtsService.start_audio(ai_response_text, cancel_token=cancel_token)
+        tts_started = bool(audio_id)
+        if not tts_started:
+            cancel_token.end_stage()
 
         processing_time = round(time.time() - start_time, 2)
-        logger.info(f'분석 완료: {emotion_result["emotion"]} / 응답: "{ai_response_text}" / 오디오: {audio_filename}')
+        logger.info(f'분석 완료: {emotion_result["emotion"]} / 응답: "{ai_response_text}" / 오디오: {audio_id}')
 
-        # 오디오 URL 생성 (static serve 필요 없음, temp_audio가 static 폴더가 아니라면 send_file 엔드포인트 필요)
-        # 현재 구조상 프론트엔드에서 접근할 수 있는 URL이어야 함. 
-        # 임시로 /api/audio/<filename> 엔드포인트를 만들거나, static으로 서빙해야 함.
-        # 일단은 상대 경로만 넘겨주고, 추가 라우트 구현 필요.
-        
         return jsonify({
             'success': True,
             'data': {
                 'text': text,
                 'responseText': ai_response_text,
-                'audioUrl': f"/api/audio/{audio_filename}" if audio_filename else "",
+                'audioUrl': f"/api/audio/{audio_id}" if audio_id else "",
                 'emotion': emotion_result.get('emotion', 'neutral'),
                 'intensity': emotion_result.get('intensity', 0.5),
                 'state': emotion_result.get('state', 'speaking'),
@@ -114,9 +144,22 @@ def analyze():
                 'confidence': stt_result.get('confidence', 0.0),
                 'language': stt_result.get('language', 'ko'),
             },
+            'requestId': request_id,
             'processing_time': processing_time,
         })
 
+    except PipelineCancelled as e:
+        saved = PipelineCancellation.record_cancelled(cancel_token)
+        return jsonify({
+            'success': False,
+            'error': {
+                'code': 'CANCELLED',
+                'message': '요청이 취소되었습니다.',
+                'details': f'stage={e.stage}, reason={e.reason}, saved={saved:.2f}s',
+            },
+            'requestId': request_id,
+        }), 499
+
     except Exception as e:
         logger.error(f'분석 파이프라인 에러: {e}', exc_info=True)
         error_code = 'WHISPER_FAILED' if 'whisper' in str(e).lower() else 'PARSE_ERROR'
@@ -130,6 +173,9 @@ def analyze():
         }), 500
 
     finally:
+        if not tts_started:
+            PipelineCancellation.unregister(cancel_token)
+
         # 6. 임시 파일 정리
         for path in [temp_webm and temp_webm.name, temp_wav]:
             if path and os.path.exists(path):
@@ -137,3 +183,24 @@ def analyze():
                     os.unlink(path)
                 except OSError:
                     pass
+
+
+@analyze_bp.route('/api/analyze/cancel', methods=['POST'])
+def cancel_analyze():
+    """진행 중인 분석 취소 엔드포인트 (requestId 또는 sessionId)"""
+    # navigator.sendBeacon은 Content-Type이 text/plain일 수 있으므로 force 파싱
+    payload = request.form or request.get_json(silent=True, force=True)
+    if not isinstance(payload, dict):
+        payload = {}
+    request_id = payload.get('requestId')
+    session_id = payload.get('sessionId')
+
+    if not request_id and not session_id:
+        return jsonify({
+            'success': False,
+            'error': {'code': 'BAD_REQUEST', 'message': 'requestId 또는 sessionId가 필요합니다.'},
+        }), 400
+
+    reason = payload.get('reason') or 'client'
+    cancelled = PipelineCancellation.cancel(request_id=request_id, session_id=session_id, reason=reason)
+    return jsonify({'success': True, 'cancelled': cancelled})
@@ -0,0 +1,247 @@
+"""
+Audio Store Service
+TTS 오디오 메모리 저장소 (TTL / 용량 제한, 합성 중 스트리밍, 디스크 spill)
+"""
+import os
+import time
+import hashlib
+import logging
+import secrets
+import threading
+from collections import OrderedDict
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_entries = OrderedDict()  # audio_id -> AudioEntry (오래된 순)
+_spilled = {}             # audio_id -> (디스크 경로, 생성 시각)
+_total_bytes = 0
+_stats = {
+    'created': 0,
+    'evicted': 0,
+    'expired': 0,
+    'spilled': 0,
+}
+
+
+class AudioEntry:
+    """오디오 한 건 (합성 중에는 청크가 계속 추가됨)"""
+
+    def __init__(self, audio_id: str, mimetype: str):
+        self.audio_id = audio_id
+        self.mimetype = mimetype
+        self.created = time.time()
+        self.chunks = []
+        self.payload = None  # 완료 시 한 번만 합친 전체 바이트
+        self.size = 0
+        self.complete = False
+        self.error = None
+        self.etag = None
+        self.cond = threading.Condition()
+
+    def data(self) -> bytes:
+        with self.cond:
+            if self.payload is not None:
+                return self.payload
+            return b''.join(self.chunks)
+
+    def expires_in(self) -> int:
+        return max(0, int(self.created + Config.AUDIO_STORE_TTL - time.time()))
+
+
+def _is_valid_id(audio_id: str) -> bool:
+    """opaque id 형식 검증 (경로 조작 방지)"""
+    return bool(audio_id) and len(audio_id) <= 64 and all(c.isalnum() or c in '-_' for c in audio_id)
+
+
+def _spill_path(audio_id: str) -> str:
+    return os.path.join(Config.UPLOAD_FOLDER, f'tts_{audio_id}.mp3')
+
+
+class AudioStore:
+    @staticmethod
+    def create(mimetype: str = 'audio/mpeg') -> str:
+        """
+        새 오디오 항목 생성
+
+        Returns:
+            opaque audio id (URL-safe)
+        """
+        AudioStore._sweep()
+        audio_id = secrets.token_urlsafe(16)
+        with _lock:
+            _entries[audio_id] = AudioEntry(audio_id, mimetype)
+            _stats['created'] += 1
+        return audio_id
+
+    @staticmethod
+    def append(audio_id: str, chunk: bytes):
+        """합성된 청크 추가 (대기 중인 스트림에 알림)"""
+        global _total_bytes
+        with _lock:
+            entry = _entries.get(audio_id)
+            if entry is None:
+                return
+            _total_bytes += len(chunk)
+        with entry.cond:
+            entry.chunks.append(chunk)
+            entry.size += len(chunk)
+            entry.cond.notify_all()
+
+    @staticmethod
+    def finish(audio_id: str, error: str = None):
+        """합성 완료(또는 실패) 처리 후 용량 제한 적용"""
+        with _lock:
+            entry = _entries.get(audio_id)
+        if entry is None:
+            return
+        with entry.cond:
+            entry.complete = True
+            entry.error = error
+            if error is None:
+                # 요청마다 다시 합치지 않도록 완료 시 한 번만 합쳐 보관
+                entry.payload = b''.join(entry.chunks)
+                entry.chunks = []
+                entry.etag = hashlib.sha1(entry.payload).hexdigest()
+            entry.cond.notify_all()
+        if error is not None:
+            AudioStore.discard(audio_id)
+        AudioStore._enforce_budget()
+
+    @staticmethod
+    def wait(audio_id: str, timeout: float = None) -> bool:
+        """합성 완료까지 대기 (성공 여부 반환)"""
+        entry = AudioStore.get(audio_id)
+        if entry is None:
+            return False
+        with entry.cond:
+            entry.cond.wait_for(lambda: entry.complete, timeout or Config.TTS_STREAM_TIMEOUT)
+            return entry.complete and entry.error is None
+
+    @staticmethod
+    def get(audio_id: str):
+        """메모리에 있는 항목 조회 (만료되었으면 None)"""
+        with _lock:
+            entry = _entries.get(audio_id)
+        if entry is not None and entry.complete and entry.expires_in() <= 0:
+            AudioStore._sweep()
+            return None
+        return entry
+
+    @staticmethod
+    def spilled_path(audio_id: str):
+        """디스크로 옮겨진 항목의 경로 (없거나 만료되었으면 None)"""
+        if not _is_valid_id(audio_id):
+            return None
+        with _lock:
+            spilled = _spilled.get(audio_id)
+        if spilled is None or time.time() - spilled[1] > Config.AUDIO_STORE_TTL:
+            return None
+        return spilled[0] if os.path.exists(spilled[0]) else None
+
+    @staticmethod
+    def stream(audio_id: str):
+        """
+        청크 제너레이터. 합성 중이면 새 청크가 들어올 때까지 기다리며 전달합니다.
+        """
+        entry = AudioStore.get(audio_id)
+        if entry is None:
+            return
+        index = 0  # 전달한 청크 수 (합성 중)
+        sent = 0   # 전달한 바이트 수
+        while True:
+            with entry.cond:
+                if not entry.cond.wait_for(
+                    lambda: index < len(entry.chunks) or entry.complete, Config.TTS_STREAM_TIMEOUT
+                ):
+                    logger.warning(f'TTS 스트리밍 타임아웃: {audio_id}')
+                    return
+                if entry.complete:
+                    # 완료 후에는 청크 대신 합쳐진 payload에서 나머지를 전달
+                    remaining = entry.payload[sent:] if entry.payload is not None else b''
+                    pending = [remaining] if remaining else []
+                else:
+                    pending = entry.chunks[index:]
+                done = entry.complete
+            index += len(pending)
+            for chunk in pending:
+                sent += len(chunk)
+                yield chunk
+            if done:
+                return
+
+    @staticmethod
+    def discard(audio_id: str):
+        """항목 제거"""
+        global _total_bytes
+        with _lock:
+            entry = _entries.pop(audio_id, None)
+            if entry is not None:
+                _total_bytes -= entry.size
+
+    @staticmethod
+    def _sweep():
+        """TTL이 지난 항목 제거 (메모리 + 디스크 spill)"""
+        global _total_bytes
+        now = time.time()
+        expired_files = []
+        with _lock:
+            for audio_id in list(_entries):
+                entry = _entries[audio_id]
+                if now - entry.created > Config.AUDIO_STORE_TTL:
+                    del _entries[audio_id]
+                    _total_bytes -= entry.size
+                    _stats['expired'] += 1
+            for audio_id, (path, created) in list(_spilled.items()):
+                if now - created > Config.AUDIO_STORE_TTL:
+                    del _spilled[audio_id]
+                    expired_files.append(path)
+        for path in expired_files:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _enforce_budget():
+        """용량 제한 초과 시 오래된 완료 항목부터 제거 (설정 시 디스크로 spill)"""
+        global _total_bytes
+        victims = []
+        with _lock:
+            for audio_id in list(_entries):
+                if _total_bytes <= Config.AUDIO_STORE_MAX_BYTES:
+                    break
+                entry = _entries[audio_id]
+                if not entry.complete:
+                    continue
+                del _entries[audio_id]
+                _total_bytes -= entry.size
+                _stats['evicted'] += 1
+                victims.append(entry)
+
+        if not Config.AUDIO_SPILL_TO_DISK:
+            return
+        for entry in victims:
+            path = _spill_path(entry.audio_id)
+            try:
+                os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.write(entry.payload)
+            except OSError as e:
+                logger.warning(f'오디오 디스크 spill 실패: {e}')
+                continue
+            with _lock:
+                _spilled[entry.audio_id] = (path, entry.created)
+                _stats['spilled'] += 1
+
+    @staticmethod
+    def stats() -> dict:
+        """저장소 통계"""
+        with _lock:
+            return {
+                **_stats,
+                'entries': len(_entries),
+                'bytes': _total_bytes,
+                'spilled_entries': len(_spilled),
+            }
@@ -0,0 +1,191 @@
+"""
+Pipeline Cancellation Service
+진행 중인 분석 파이프라인 취소 (클라이언트 끼어들기 / 연결 끊김)
+"""
+import time
+import select
+import socket
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 파이프라인 단계 (실행 순서)
+PIPELINE_STAGES = ('convert', 'stt', 'emotion', 'response', 'tts')
+
+# 단계별 평균 소요 시간 (지수이동평균) - 절약된 연산 시간 추정용
+_STAGE_EMA_ALPHA = 0.2
+
+_lock = threading.Lock()
+_active_tokens = {}  # request_id -> CancelToken
+_stage_avg = {}      # stage -> seconds
+_stats = {
+    'cancelled': 0,
+    'by_reason': {},
+    'saved_seconds': 0.0,
+}
+
+
+class PipelineCancelled(Exception):
+    """파이프라인이 취소되었을 때 발생"""
+
+    def __init__(self, reason: str, stage: str = None):
+        super().__init__(f'파이프라인 취소됨 ({reason}, 단계: {stage})')
+        self.reason = reason
+        self.stage = stage
+
+
+class CancelToken:
+    """요청 단위 취소 토큰"""
+
+    def __init__(self, request_id: str, session_id: str = None, disconnect_check=None):
+        self.request_id = request_id
+        self.session_id = session_id
+        self.reason = None
+        self._event = threading.Event()
+        self._disconnect_check = disconnect_check
+        self._stage = None
+        self._stage_start = None
+
+    def cancel(self, reason: str = 'client'):
+        """취소 요청 (최초 사유만 기록)"""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def is_cancelled(self) -> bool:
+        """취소 여부 확인 (클라이언트 연결 끊김 포함)"""
+        if self._event.is_set():
+            return True
+        if self._disconnect_check and self._disconnect_check():
+            self.cancel('disconnect')
+            return True
+        return False
+
+    def detach_disconnect(self):
+        """응답 전송 후에도 이어지는 작업(TTS 합성)용: 연결 종료를 더 이상 취소로 보지 않음"""
+        self._disconnect_check = None
+
+    def check(self):
+        """취소되었으면 PipelineCancelled 발생"""
+        if self.is_cancelled():
+            raise PipelineCancelled(self.reason, self._stage)
+
+    def begin_stage(self, stage: str):
+        """다음 단계 시작 전 취소 확인 후 시작 시각 기록"""
+        self.end_stage()
+        self._stage = stage
+        self._stage_start = None
+        self.check()
+        self._stage_start = time.time()
+
+    def end_stage(self):
+        """현재 단계 완료 - 소요 시간을 평균에 반영"""
+        if self._stage and self._stage_start is not None:
+            PipelineCancellation.record_stage(self._stage, time.time() - self._stage_start)
+        self._stage_start = None
+
+
+def make_disconnect_check(environ: dict):
+    """
+    WSGI 환경에서 클라이언트 연결 끊김 감지 함수를 만듭니다.
+    요청 본문을 모두 읽은 뒤 소켓이 읽기 가능한데 데이터가 없으면(EOF) 끊긴 것으로 판단.
+
+    Returns:
+        호출 시 끊김 여부(bool)를 반환하는 함수, 소켓을 알 수 없으면 None
+    """
+    sock = environ.get('werkzeug.socket')
+    if sock is None:
+        return None
+
+    def check() -> bool:
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+            if not readable:
+                return False
+            return sock.recv(1, socket.MSG_PEEK) == b''
+        except (OSError, ValueError):
+            return True
+
+    return check
+
+
+class PipelineCancellation:
+    @staticmethod
+    def register(request_id: str, session_id: str = None, disconnect_check=None) -> CancelToken:
+        """새 요청의 취소 토큰 등록"""
+        token = CancelToken(request_id, session_id, disconnect_check)
+        with _lock:
+            _active_tokens[request_id] = token
+        return token
+
+    @staticmethod
+    def unregister(token: CancelToken):
+        """요청 완료 후 토큰 제거"""
+        with _lock:
+            if _active_tokens.get(token.request_id) is token:
+                del _active_tokens[token.request_id]
+
+    @staticmethod
+    def cancel(request_id: str = None, session_id: str = None, reason: str = 'client') -> int:
+        """
+        요청 ID 또는 세션 ID로 진행 중인 파이프라인을 취소합니다.
+
+        Returns:
+            취소 요청된 파이프라인 수
+        """
+        with _lock:
+            targets = [
+                t for t in _active_tokens.values()
+                if (request_id and t.request_id == request_id)
+                or (session_id and t.session_id == session_id)
+            ]
+        for token in targets:
+            token.cancel(reason)
+        if targets:
+            logger.info(f'파이프라인 취소 요청: {len(targets)}건 (사유: {reason})')
+        return len(targets)
+
+    @staticmethod
+    def record_stage(stage: str, seconds: float):
+        """단계 소요 시간 기록 (지수이동평균)"""
+        with _lock:
+            prev = _stage_avg.get(stage)
+            _stage_avg[stage] = seconds if prev is None else prev + _STAGE_EMA_ALPHA * (seconds - prev)
+
+    @staticmethod
+    def record_cancelled(token: CancelToken) -> float:
+        """
+        취소 완료 기록. 취소된 단계의 남은 시간 + 이후 단계들의 평균 시간을 절약된 시간으로 추정.
+
+        Returns:
+            절약된 연산 시간 추정치 (초)
+        """
+        stage = token._stage
+        with _lock:
+            saved = 0.0
+            if stage in PIPELINE_STAGES:
+                elapsed = time.time() - token._stage_start if token._stage_start else 0.0
+                saved += max(0.0, _stage_avg.get(stage, 0.0) - elapsed)
+                for later in PIPELINE_STAGES[PIPELINE_STAGES.index(stage) + 1:]:
+                    saved += _stage_avg.get(later, 0.0)
+
+            reason = token.reason or 'client'
+            _stats['cancelled'] += 1
+            _stats['by_reason'][reason] = _stats['by_reason'].get(reason, 0) + 1
+            _stats['saved_seconds'] += saved
+
+        logger.info(f'파이프라인 취소 완료: {token.request_id} (단계: {stage}, 사유: {reason}, 절약: {saved:.2f}초)')
+        return saved
+
+    @staticmethod
+    def stats() -> dict:
+        """취소 통계"""
+        with _lock:
+            return {
+                'active': len(_active_tokens),
+                'cancelled': _stats['cancelled'],
+                'by_reason': dict(_stats['by_reason']),
+                'saved_seconds': round(_stats['saved_seconds'], 2),
+                'stage_avg_seconds': {k: round(v, 3) for k, v in _stage_avg.items()},
+            }
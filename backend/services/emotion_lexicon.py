@@ -0,0 +1,120 @@
+"""
+Emotion Lexicon Service
+텍스트 → 감정 분석 (로컬 키워드 사전, LLM 호출 전 빠른 경로)
+"""
+import re
+
+# 감정별 키워드 (어간 기준 부분 문자열 매칭, 가중치)
+# 가중치 2.0 이상은 단독으로도 확신할 수 있는 표현
+EMOTION_LEXICON = {
+    'happy': {
+        '행복': 2.0, '기뻐': 2.0, '기쁘': 2.0, '기분 좋': 2.0, '기분좋': 2.0, '좋아': 1.0,
+        '좋다': 1.0, '고마워': 1.5, '고맙': 1.5, '감사': 1.0, '즐거': 2.0, '웃겨': 1.5,
+        '만족': 1.5, '다행': 1.5, '사랑': 1.5,
+    },
+    'sad': {
+        '슬퍼': 2.0, '슬프': 2.0, '우울': 2.0, '눈물': 2.0, '울고': 1.5, '외로': 2.0,
+        '속상': 2.0, '힘들': 1.5, '그리워': 1.5, '보고 싶': 1.0, '상실': 1.5, '허전': 1.5,
+        '서운': 1.5, '아쉽': 1.0,
+    },
+    'angry': {
+        '짜증': 2.0, '화나': 2.0, '화가': 2.0, '열받': 2.0, '빡치': 2.0, '분노': 2.0,
+        '어이없': 1.5, '싫어': 1.0, '최악': 1.5, '미치겠': 1.5, '답답': 1.0, '억울': 1.5,
+    },
+    'excited': {
+        '신나': 2.0, '신난': 2.0, '설레': 2.0, '드디어': 2.0, '최고': 1.5,
+        '우와': 1.5, '기대': 1.5, '흥분': 2.0, '짱': 1.5,
+    },
+    'thinking': {
+        '고민': 2.0, '생각 중': 2.0, '생각중': 2.0, '궁금': 1.5, '어떻게': 1.0, '왜 ': 1.0,
+        '방법': 1.0, '모르겠': 1.5, '할까': 1.0, '일까': 1.0, '구현': 1.0,
+    },
+    'calm': {
+        '편안': 2.0, '평온': 2.0, '차분': 2.0, '여유': 1.5, '느긋': 2.0, '안정': 1.5,
+        '괜찮': 1.0, '쉬고': 1.0, '산책': 1.0, '조용': 1.0,
+    },
+    'neutral': {
+        '그냥': 1.0, '보통': 1.5, '평범': 1.5, '그저 그': 1.5, '별로 없': 1.0,
+    },
+}
+
+# 강조 표현 (강도 증가)
+# "와", "대박"은 감정 방향과 무관하게 쓰이므로 ("대박 망했다", "너와") 감정 키워드가 아닌 강조로만 취급
+INTENSIFIERS = ('정말', '진짜', '너무', '완전', '엄청', '매우', '아주', '되게', '겁나', '대박')
+
+# 부정 표현 - 키워드 앞: "안 좋아", "못 웃겨"
+NEGATION_BEFORE = re.compile(r'(안|못)\s*$')
+# 부정 표현 - 키워드 뒤 짧은 구간: "기쁘지 않아", "행복하지는 않아", "기쁘지가 않아", "즐겁지도 않아",
+# "행복하지 못해", "짜증 안 나", "행복한 게 아니야", "슬픈 건 아니고"
+# (감탄사 "아니"는 제외: "행복해 아니 진짜")
+NEGATION_AFTER = re.compile(r'(^\s*(않|없|아니)|지\s*(는|도|가)?\s*(않|못)|\s안\s|(게|건|거|것이|것은)\s*아니)')
+NEGATION_AFTER_WINDOW = 7
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키/매칭용 정규화 (공백 정리, 소문자)"""
+    return _WHITESPACE.sub(' ', (text or '').strip()).lower()
+
+
+class EmotionLexicon:
+    @staticmethod
+    def _has_affirmed(normalized: str, term: str) -> bool:
+        """
+        키워드가 부정되지 않은 형태로 한 번이라도 나오는지 확인합니다.
+        ("안 좋아", "기쁘지 않아", "짜증 안 나" 같은 부정 표현은 제외)
+        """
+        index = normalized.find(term)
+        while index >= 0:
+            before = normalized[max(0, index - 3):index]
+            end = index + len(term)
+            after = normalized[end:end + NEGATION_AFTER_WINDOW]
+            if not NEGATION_BEFORE.search(before) and not NEGATION_AFTER.search(after):
+                return True
+            index = normalized.find(term, index + 1)
+        return False
+
+    @staticmethod
+    def score(text: str) -> dict:
+        """
+        키워드 사전으로 감정을 추정합니다.
+
+        Args:
+            text: 분석할 텍스트
+
+        Returns:
+            {"emotion": "angry", "intensity": 0.8, "state": "speaking", "keywords": ["짜증"], "confidence": 1.0}
+        """
+        normalized = normalize_text(text) + ' '
+        scores = {}
+        matched = {}
+
+        for emotion, terms in EMOTION_LEXICON.items():
+            for term, weight in terms.items():
+                if not EmotionLexicon._has_affirmed(normalized, term):
+                    continue
+                scores[emotion] = scores.get(emotion, 0.0) + weight
+                matched.setdefault(emotion, []).append(term.strip())
+
+        if not scores:
+            return {'emotion': 'neutral', 'intensity': 0.5, 'state': 'speaking', 'keywords': [], 'confidence': 0.0}
+
+        ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+        emotion, top = ranked[0]
+        second = ranked[1][1] if len(ranked) > 1 else 0.0
+
+        # 확신도: 최고 점수의 크기(2.0이면 충분) × 2위와의 차이 비율
+        confidence = min(1.0, top / 2.0) * ((top - second) / top)
+
+        boost = sum(0.1 for word in INTENSIFIERS if word in normalized)
+        boost += min(0.1, 0.05 * normalized.count('!'))
+        intensity = max(0.0, min(1.0, 0.55 + 0.1 * top + boost))
+
+        return {
+            'emotion': emotion,
+            'intensity': round(intensity, 2),
+            'state': 'thinking' if emotion == 'thinking' else 'speaking',
+            'keywords': matched[emotion][:5],
+            'confidence': round(confidence, 2),
+        }
@@ -1,12 +1,17 @@
 """
 Ollama Emotion Analysis Service
-텍스트 → 감정 분석 (로컬 Ollama LLM)
+텍스트 → 감정 분석 (로컬 키워드 사전 빠른 경로 + Ollama LLM)
 """
 import json
 import re
+import random
 import logging
+import threading
+from collections import OrderedDict
 import ollama as ollama_client
 from config import Config
+from services.cancellation import PipelineCancelled
+from services.emotion_lexicon import EmotionLexicon, normalize_text
 
 logger = logging.getLogger(__name__)
 
@@ -44,15 +49,61 @@ EMOTION_PROMPT = """당신은 전문 감정 분석 AI입니다.
 VALID_EMOTIONS = {'happy', 'sad', 'angry', 'neutral', 'excited', 'thinking', 'calm'}
 DEFAULT_RESULT = {'emotion': 'neutral', 'intensity': 0.5, 'state': 'speaking', 'keywords': []}
 
+# 감정 분석 결과 LRU 캐시 (정규화된 텍스트 → 결과) 및 통계
+_emotion_lock = threading.Lock()
+_emotion_cache = OrderedDict()
+_emotion_stats = {
+    'requests': 0,
+    'cache_hits': 0,
+    'fast_path': 0,
+    'llm_calls': 0,
+    # 로컬 추정과 LLM 결과 비교 (audit: 빠른 경로 샘플, fallback: 확신도 낮아 LLM으로 넘긴 경우)
+    'audit_compared': 0,
+    'audit_agreed': 0,
+    'fallback_compared': 0,
+    'fallback_agreed': 0,
+}
+
 
 class OllamaService:
     @staticmethod
-    def analyze_emotion(text: str) -> dict:
+    def _chat(messages: list, options: dict, cancel_token=None) -> str:
+        """
+        Ollama chat 호출. 취소 토큰이 있으면 스트리밍으로 받으며
+        청크마다 취소 여부를 확인하고, 취소 시 스트림을 닫아 생성을 중단합니다.
+        """
+        if cancel_token is None:
+            response = ollama_client.chat(
+                model=Config.OLLAMA_MODEL, messages=messages, options=options,
+            )
+            return response['message']['content'].strip()
+
+        cancel_token.check()
+        stream = ollama_client.chat(
+            model=Config.OLLAMA_MODEL, messages=messages, options=options, stream=True,
+        )
+        parts = []
+        try:
+            for chunk in stream:
+                cancel_token.check()
+                parts.append(chunk['message']['content'])
+        finally:
+            # 스트림 연결을 닫으면 Ollama 서버도 생성을 중단
+            close = getattr(stream, 'close', None)
+            if close:
+                close()
+        return ''.join(parts).strip()
+
+    @staticmethod
+    def analyze_emotion(text: str, cancel_token=None, raise_on_error: bool = False) -> dict:
         """
         텍스트의 감정을 분석합니다.
+        캐시 → 로컬 키워드 사전 → (확신도가 임계값 미만일 때만) LLM 순으로 처리합니다.
 
         Args:
             text: 분석할 텍스트
+            cancel_token: 취소 토큰 (선택, 취소 시 PipelineCancelled 발생)
+            raise_on_error: True면 LLM 실패 시 기본값 대신 RuntimeError 발생 (일괄 처리에서 재시도 대상 표시용)
 
         Returns:
             {"emotion": "happy", "intensity": 0.85, "state": "speaking", "keywords": ["기분", "좋아"]}
@@ -60,25 +111,108 @@ class OllamaService:
         if not text or not text.strip():
             return DEFAULT_RESULT.copy()
 
+        key = normalize_text(text)
+        with _emotion_lock:
+            _emotion_stats['requests'] += 1
+            cached = _emotion_cache.get(key)
+            if cached is not None:
+                _emotion_cache.move_to_end(key)
+                _emotion_stats['cache_hits'] += 1
+                return dict(cached, keywords=list(cached['keywords']))
+
+        # 1단계: 로컬 키워드 사전
+        local = EmotionLexicon.score(text)
+        confidence = local.pop('confidence')
+
+        if confidence >= Config.EMOTION_FASTPATH_THRESHOLD:
+            result = local
+            with _emotion_lock:
+                _emotion_stats['fast_path'] += 1
+            if Config.EMOTION_AUDIT_RATE > 0 and random.random() < Config.EMOTION_AUDIT_RATE:
+                # 빠른 경로 정확도 측정용 샘플: 백그라운드에서 LLM과 비교
+                threading.Thread(
+                    target=OllamaService._audit_fast_path, args=(text, local['emotion']), daemon=True
+                ).start()
+        else:
+            # 2단계: 확신도가 낮으면 LLM
+            result = OllamaService._analyze_emotion_llm(text, cancel_token)
+            if result is None:
+                if raise_on_error:
+                    raise RuntimeError('LLM 감정 분석 실패')
+                return DEFAULT_RESULT.copy()
+            if local['keywords']:
+                # 사전에 걸린 단어가 있었던 경우만 비교 (추정 자체가 없으면 제외)
+                OllamaService._record_agreement('fallback', local['emotion'], result['emotion'])
+
+        with _emotion_lock:
+            _emotion_cache[key] = result
+            _emotion_cache.move_to_end(key)
+            while len(_emotion_cache) > Config.EMOTION_CACHE_SIZE:
+                _emotion_cache.popitem(last=False)
+        return dict(result, keywords=list(result['keywords']))
+
+    @staticmethod
+    def _analyze_emotion_llm(text: str, cancel_token=None):
+        """LLM 감정 분석 (실패 시 None)"""
+        with _emotion_lock:
+            _emotion_stats['llm_calls'] += 1
+
         try:
             prompt = EMOTION_PROMPT.replace('{user_text}', text)
 
-            response = ollama_client.chat(
-                model=Config.OLLAMA_MODEL,
+            response_text = OllamaService._chat(
                 messages=[{'role': 'user', 'content': prompt}],
                 options={'temperature': 0.1, 'num_predict': 200},
+                cancel_token=cancel_token,
             )
-
-            response_text = response['message']['content'].strip()
             logger.debug(f'Ollama 원본 응답: {response_text}')
 
             # JSON 추출 및 파싱
             result = OllamaService._parse_json_response(response_text)
             return result
 
+        except PipelineCancelled:
+            raise
         except Exception as e:
             logger.error(f'Ollama 감정 분석 에러: {e}')
-            return DEFAULT_RESULT.copy()
+            return None
+
+    @staticmethod
+    def _audit_fast_path(text: str, local_emotion: str):
+        """빠른 경로 결과를 LLM 결과와 비교 (통계용)"""
+        result = OllamaService._analyze_emotion_llm(text)
+        if result is not None:
+            OllamaService._record_agreement('audit', local_emotion, result['emotion'])
+
+    @staticmethod
+    def _record_agreement(kind: str, local_emotion: str, llm_emotion: str):
+        """로컬 추정과 LLM 결과 일치 여부 기록 (kind: 'audit' / 'fallback')"""
+        with _emotion_lock:
+            _emotion_stats[f'{kind}_compared'] += 1
+            if local_emotion == llm_emotion:
+                _emotion_stats[f'{kind}_agreed'] += 1
+
+    @staticmethod
+    def emotion_stats() -> dict:
+        """감정 분석 빠른 경로 / 캐시 통계"""
+        with _emotion_lock:
+            stats = dict(_emotion_stats)
+            cache_size = len(_emotion_cache)
+        requests = stats['requests']
+
+        def agreement(kind):
+            compared = stats[f'{kind}_compared']
+            return round(stats[f'{kind}_agreed'] / compared, 3) if compared else None
+
+        return {
+            **stats,
+            'cache_size': cache_size,
+            'cache_hit_rate': round(stats['cache_hits'] / requests, 3) if requests else 0.0,
+            'fast_path_hit_rate': round(stats['fast_path'] / requests, 3) if requests else 0.0,
+            # 빠른 경로로 답한 결과의 정확도 (샘플 감사) / 저확신 입력에서 사전 추정이 맞았던 비율
+            'fast_path_agreement': agreement('audit'),
+            'fallback_agreement': agreement('fallback'),
+        }
 
     @staticmethod
     def _parse_json_response(text: str) -> dict:
@@ -121,13 +255,14 @@ class OllamaService:
         }
 
     @staticmethod
-    def generate_response(user_text: str, emotion: str = 'neutral') -> str:
+    def generate_response(user_text: str, emotion: str = 'neutral', cancel_token=None) -> str:
         """
         사용자 입력에 대한 AI 응답을 생성합니다.
         
         Args:
             user_text: 사용자 입력
             emotion: 분석된 감정 (참고용)
+            cancel_token: 취소 토큰 (선택, 취소 시 PipelineCancelled 발생)
             
         Returns:
             AI 응답 텍스트 (예: "네, 알겠습니다.")
@@ -142,19 +277,19 @@ class OllamaService:
         )
 
         try:
-            response = ollama_client.chat(
-                model=Config.OLLAMA_MODEL,
+            answer = OllamaService._chat(
                 messages=[
                     {'role': 'system', 'content': system_prompt},
                     {'role': 'user', 'content': user_text}
                 ],
                 options={'temperature': 0.7, 'num_predict': 100},
+                cancel_token=cancel_token,
             )
-            
-            answer = response['message']['content'].strip()
             logger.info(f"AI 응답 생성: {answer}")
             return answer
 
+        except PipelineCancelled:
+            raise
         except Exception as e:
             logger.error(f"Ollama 대화 생성 실패: {e}")
             return "죄송해요, 지금은 대답하기 어렵네요."
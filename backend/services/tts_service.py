@@ -2,62 +2,70 @@
 TTS Service
 텍스트 → 음성 변환 (edge-tts)
 """
-import os
 import asyncio
 import logging
-import uuid
-from config import Config
+import threading
+from services.audio_store import AudioStore
+from services.cancellation import PipelineCancellation, PipelineCancelled
 import edge_tts
 
 logger = logging.getLogger(__name__)
 
+TTS_VOICE = 'ko-KR-SunHiNeural'
+
+
 class TtsService:
     @staticmethod
-    async def _generate_audio_async(text: str, output_path: str, voice: str = 'ko-KR-SunHiNeural'):
-        """비동기 TTS 생성"""
+    async def _stream_audio_async(text: str, audio_id: str, voice: str = TTS_VOICE, cancel_token=None):
+        """비동기 TTS 생성 - 합성되는 청크를 바로 메모리 저장소에 추가 (청크마다 취소 확인)"""
         communicate = edge_tts.Communicate(text, voice)
-        await communicate.save(output_path)
+        async for chunk in communicate.stream():
+            if cancel_token:
+                cancel_token.check()
+            if chunk['type'] == 'audio':
+                AudioStore.append(audio_id, chunk['data'])
+
+    @staticmethod
+    def _synthesize(text: str, audio_id: str, cancel_token=None):
+        """
+        (백그라운드 스레드) 합성 실행 후 완료/실패 기록
+        cancel_token이 있으면 합성이 끝날 때까지 등록 상태를 유지하고, 실제 합성 시간을 'tts' 단계로 기록
+        """
+        try:
+            # 스레드마다 새 이벤트 루프 사용 (Flask는 동기)
+            asyncio.run(TtsService._stream_audio_async(text, audio_id, cancel_token=cancel_token))
+            if cancel_token:
+                cancel_token.end_stage()
+            AudioStore.finish(audio_id)
+            logger.info(f"TTS 생성 완료: {audio_id}")
+        except PipelineCancelled as e:
+            PipelineCancellation.record_cancelled(cancel_token)
+            AudioStore.finish(audio_id, error=str(e))
+        except Exception as e:
+            logger.error(f"TTS 생성 실패: {e}")
+            AudioStore.finish(audio_id, error=str(e))
+        finally:
+            if cancel_token:
+                PipelineCancellation.unregister(cancel_token)
 
     @staticmethod
-    def generate_audio(text: str) -> str:
+    def start_audio(text: str, cancel_token=None) -> str:
         """
-        텍스트를 음성 파일로 변환합니다.
-        
+        TTS 합성을 백그라운드에서 시작하고 바로 반환합니다.
+        합성 중인 오디오도 /api/audio/<id>로 스트리밍 재생할 수 있습니다.
+
         Args:
             text: 변환할 텍스트
-            
+            cancel_token: 취소 토큰 (선택). 합성 스레드로 넘겨져 합성이 끝나면 해제됩니다.
+
         Returns:
-            생성된 오디오 파일의 상대 경로 (예: /temp_audio/tts_xyz.mp3)
+            오디오 id (빈 텍스트면 "")
         """
         if not text or not text.strip():
             return ""
 
-        try:
-            filename = f"tts_{uuid.uuid4().hex[:8]}.mp3"
-            output_path = os.path.join(Config.UPLOAD_FOLDER, filename)
-            
-            # 비동기 함수 실행 (Event Loop 처리)
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # 이미 루프가 돌고 있다면 (예: 이미 비동기 환경)
-                    # 이 경우 별도 태스크로 돌려야 하지만, Flask는 보통 동기.
-                    # 안전을 위해 new_event_loop 사용 고려
-                    asyncio.run(TtsService._generate_audio_async(text, output_path))
-                else:
-                    loop.run_until_complete(TtsService._generate_audio_async(text, output_path))
-            except RuntimeError:
-                # "There is no current event loop" or similar
-                asyncio.run(TtsService._generate_audio_async(text, output_path))
-
-            logger.info(f"TTS 생성 완료: {filename}")
-            
-            # URL 경로 반환 (API에서 접근 가능하도록)
-            # 실제로는 static 폴더나 send_file로 처리해야 함.
-            # analyze.py에서 UPLOAD_FOLDER가 static으로 서빙되는지 확인 필요.
-            # 일단 파일명만 반환.
-            return filename
-
-        except Exception as e:
-            logger.error(f"TTS 생성 실패: {e}")
-            return ""
+        audio_id = AudioStore.create('audio/mpeg')
+        threading.Thread(
+            target=TtsService._synthesize, args=(text, audio_id, cancel_token), daemon=True
+        ).start()
+        return audio_id
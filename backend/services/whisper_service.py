@@ -2,7 +2,12 @@
 Whisper STT Service
 음성 → 텍스트 변환 (로컬 Whisper 모델)
 """
+import os
+import re
+import glob
+import time
 import logging
+from contextlib import contextmanager
 from config import Config
 
 logger = logging.getLogger(__name__)
@@ -10,41 +15,242 @@ logger = logging.getLogger(__name__)
 # 싱글턴 모델 인스턴스
 _model = None
 _model_loaded = False
+_model_source = None  # 'checkpoint' / 'mmap-cache' / 'mmap-cache (built)'
+
+# 캐시 생성 잠금이 이보다 오래되면 중단된 프로세스가 남긴 것으로 보고 제거 (초)
+_CACHE_LOCK_STALE_SECONDS = 600
+
+
+def _cache_key(model_name: str, source_id: str, whisper_version: str, torch_version: str) -> str:
+    """
+    mmap 캐시 파일 이름 (모델 이름 / 원본 체크포인트 / 라이브러리 버전이 바뀌면 달라짐)
+    """
+    torch_minor = '.'.join(torch_version.split('+')[0].split('.')[:2])
+    return f'{_cache_prefix(model_name)}__{source_id}__whisper{whisper_version}__torch{torch_minor}'
+
+
+def _cache_prefix(model_name: str) -> str:
+    """모델 이름 → 캐시 파일 접두어 (파일명에 안전한 문자만)"""
+    return re.sub(r'[^A-Za-z0-9.-]+', '-', os.path.basename(model_name))
+
+
+def _prune_stale_cache(cache_dir: str, model_name: str, key: str):
+    """같은 모델의 이전 버전 캐시 파일 삭제"""
+    for path in glob.glob(os.path.join(cache_dir, f'{_cache_prefix(model_name)}__*.pt')):
+        if os.path.basename(path) != f'{key}.pt':
+            try:
+                os.unlink(path)
+                logger.info(f'오래된 Whisper 캐시 삭제: {path}')
+            except OSError:
+                pass
+
+
+@contextmanager
+def _cache_lock(lock_path: str, poll_interval: float = 0.5):
+    """
+    프로세스 간 캐시 생성 잠금 (잠금 파일 O_EXCL 생성).
+    동시에 시작한 여러 워커 중 한 프로세스만 캐시를 만들고 나머지는 대기합니다.
+    """
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > _CACHE_LOCK_STALE_SECONDS:
+                    logger.warning(f'오래된 Whisper 캐시 잠금 제거: {lock_path}')
+                    os.unlink(lock_path)
+                    continue
+            except OSError:
+                # 대기 중 잠금이 해제됨 - 바로 재시도
+                continue
+            time.sleep(poll_interval)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.unlink(lock_path)
+        except OSError:
+            pass
 
 
 class WhisperService:
     @staticmethod
     def _load_model():
         """모델 로드 (최초 1회)"""
-        global _model, _model_loaded
+        global _model, _model_loaded, _model_source
         if _model_loaded:
             return
 
         logger.info(f'Whisper 모델 로딩 중... (모델: {Config.WHISPER_MODEL})')
-        import whisper
-        _model = whisper.load_model(Config.WHISPER_MODEL)
+        start = time.time()
+        source = 'checkpoint'
+        model = None
+        if Config.WHISPER_MMAP_CACHE:
+            try:
+                model, source = WhisperService._load_from_mmap_cache(Config.WHISPER_MODEL)
+            except Exception as e:
+                logger.warning(f'Whisper mmap 캐시 로드 실패, 원본 체크포인트 사용: {e}')
+
+        if model is None:
+            import whisper
+            model = whisper.load_model(Config.WHISPER_MODEL)
+
+        _model = model
+        _model_source = source
         _model_loaded = True
-        logger.info('Whisper 모델 로딩 완료')
+        logger.info(f'Whisper 모델 로딩 완료 ({source}, {time.time() - start:.2f}초)')
+
+    @staticmethod
+    def _checkpoint_id(model_name: str) -> str:
+        """원본 체크포인트 식별자 (공식 모델은 URL의 SHA256, 로컬 파일은 크기+수정시각)"""
+        import whisper
+
+        if model_name in whisper._MODELS:
+            return whisper._MODELS[model_name].split('/')[-2][:12]
+        stat = os.stat(model_name)
+        return f'{stat.st_size:x}{int(stat.st_mtime):x}'
+
+    @staticmethod
+    def _load_from_mmap_cache(model_name: str):
+        """
+        메모리 매핑 캐시에서 모델 로드. 캐시가 없으면 원본 체크포인트를 한 번 변환합니다.
+        가중치는 파일을 mmap한 텐서를 그대로 사용하므로 역직렬화/복사가 없고,
+        여러 프로세스가 같은 페이지를 OS 페이지 캐시로 공유합니다.
+
+        Returns:
+            (model, source) - source는 'mmap-cache' 또는 'mmap-cache (built)'
+        """
+        import torch
+        import whisper
+
+        key = _cache_key(model_name, WhisperService._checkpoint_id(model_name),
+                         whisper.__version__, torch.__version__)
+        cache_path = os.path.join(Config.WHISPER_CACHE_DIR, f'{key}.pt')
+
+        source = 'mmap-cache'
+        if not os.path.exists(cache_path):
+            os.makedirs(Config.WHISPER_CACHE_DIR, exist_ok=True)
+            with _cache_lock(f'{cache_path}.lock'):
+                # 잠금을 기다리는 동안 다른 프로세스가 만들었으면 그대로 사용
+                if not os.path.exists(cache_path):
+                    WhisperService._build_mmap_cache(model_name, cache_path)
+                    _prune_stale_cache(Config.WHISPER_CACHE_DIR, model_name, key)
+                    source = 'mmap-cache (built)'
+
+        checkpoint = torch.load(cache_path, map_location='cpu', mmap=True, weights_only=True)
+        model = WhisperService._model_from_checkpoint(checkpoint)
+
+        device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        return model.to(device), source
+
+    @staticmethod
+    def _model_from_checkpoint(checkpoint: dict):
+        """mmap 캐시 체크포인트의 텐서를 복사 없이 연결한 Whisper 모델 생성"""
+        import torch
+        from whisper.model import AudioEncoder, ModelDimensions, TextDecoder, Whisper
+
+        # 빈(meta) 모델을 만든 뒤 mmap 텐서를 그대로 연결 (가중치 초기화/복사 생략)
+        # Whisper.__init__은 alignment_heads에 to_sparse()를 호출하는데 meta 텐서에서는 지원되지 않으므로
+        # 인코더/디코더만 meta로 만들어 조립하고, alignment_heads는 아래에서 캐시 값으로 등록
+        dims = ModelDimensions(**checkpoint['dims'])
+        with torch.device('meta'):
+            encoder = AudioEncoder(dims.n_mels, dims.n_audio_ctx, dims.n_audio_state,
+                                   dims.n_audio_head, dims.n_audio_layer)
+            decoder = TextDecoder(dims.n_vocab, dims.n_text_ctx, dims.n_text_state,
+                                  dims.n_text_head, dims.n_text_layer)
+        model = Whisper.__new__(Whisper)
+        torch.nn.Module.__init__(model)
+        model.dims = dims
+        model.encoder = encoder
+        model.decoder = decoder
+        model.load_state_dict(checkpoint['state_dict'], assign=True)
+
+        # state_dict에 없는 비영속 버퍼 (디코더 mask, alignment_heads)
+        for name, tensor in checkpoint['buffers'].items():
+            module_name, _, buffer_name = name.rpartition('.')
+            if name in checkpoint['sparse_buffers']:
+                tensor = tensor.to_sparse()
+            model.get_submodule(module_name).register_buffer(buffer_name, tensor, persistent=False)
+        return model
+
+    @staticmethod
+    def _build_mmap_cache(model_name: str, cache_path: str):
+        """원본 체크포인트를 mmap 가능한 torch 포맷으로 변환하여 저장"""
+        import torch
+        import whisper
+
+        logger.info(f'Whisper mmap 캐시 생성 중: {cache_path}')
+        model = whisper.load_model(model_name, device='cpu')
+
+        state_dict = model.state_dict()
+        buffers, sparse_buffers = {}, []
+        for name, tensor in model.named_buffers():
+            if name in state_dict:
+                continue
+            if tensor.is_sparse:
+                sparse_buffers.append(name)
+                tensor = tensor.to_dense()
+            buffers[name] = tensor
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        torch.save({
+            'dims': vars(model.dims),
+            'state_dict': state_dict,
+            'buffers': buffers,
+            'sparse_buffers': sparse_buffers,
+        }, tmp_path)
+        # 다른 프로세스가 동시에 만들어도 완성된 파일만 보이도록 원자적 교체
+        os.replace(tmp_path, cache_path)
 
     @staticmethod
-    def transcribe(audio_path: str) -> dict:
+    def get_profile(profile: str = None) -> dict:
+        """
+        디코딩 프로파일 조회
+
+        Args:
+            profile: 프로파일 이름 (None이면 Config.WHISPER_PROFILE)
+
+        Raises:
+            ValueError: 알 수 없는 프로파일
+        """
+        name = profile or Config.WHISPER_PROFILE
+        if name not in Config.WHISPER_PROFILES:
+            raise ValueError(f'알 수 없는 Whisper 프로파일: {name}')
+        return dict(Config.WHISPER_PROFILES[name])
+
+    @staticmethod
+    def transcribe(audio_path: str, profile: str = None) -> dict:
         """
         음성 파일 → 텍스트 변환
 
         Args:
             audio_path: .wav 파일 경로
+            profile: 디코딩 프로파일 이름 (realtime / balanced / accurate)
 
         Returns:
-            {"text": "인식된 텍스트", "language": "ko", "confidence": 0.95}
+            {"text": "인식된 텍스트", "language": "ko", "confidence": 0.95, "profile": "realtime"}
         """
+        options = WhisperService.get_profile(profile)
+        profile_name = profile or Config.WHISPER_PROFILE
         WhisperService._load_model()
 
         try:
-            result = _model.transcribe(
-                audio_path,
-                language='ko',
-                fp16=False,  # CPU 호환성
-            )
+            single_window = options.pop('single_window', False)
+            result = None
+            if single_window:
+                result = WhisperService._decode_single_window(audio_path, options)
+
+            if result is None:
+                result = _model.transcribe(
+                    audio_path,
+                    language='ko',
+                    fp16=False,  # CPU 호환성
+                    **options,
+                )
 
             text = result.get('text', '').strip()
 
@@ -59,13 +265,72 @@ class WhisperService:
                 'text': text,
                 'language': result.get('language', 'ko'),
                 'confidence': round(avg_confidence, 2),
+                'profile': profile_name,
             }
 
         except Exception as e:
             logger.error(f'Whisper STT 에러: {e}')
             raise RuntimeError(f'Whisper 음성 인식 실패: {e}')
 
+    @staticmethod
+    def _decode_single_window(audio_path: str, options: dict):
+        """
+        30초 이하 클립을 단일 윈도우로 한 번만 디코딩합니다.
+        transcribe()는 입력 뒤에 30초 패딩을 붙이고 seek 루프를 돌기 때문에
+        짧은 클립에서는 불필요한 오버헤드가 생깁니다.
+
+        Returns:
+            transcribe()와 같은 형태의 dict, 클립이 길면 None
+        """
+        import whisper
+
+        audio = whisper.load_audio(audio_path)
+        if len(audio) > whisper.audio.N_SAMPLES:
+            return None
+
+        mel = whisper.log_mel_spectrogram(
+            whisper.pad_or_trim(audio), _model.dims.n_mels
+        ).to(_model.device)
+
+        temperature = options.get('temperature', 0.0)
+        if isinstance(temperature, (list, tuple)):
+            temperature = temperature[0]
+
+        decode_options = whisper.DecodingOptions(
+            language='ko',
+            fp16=False,
+            temperature=temperature,
+            # greedy(T=0)에서는 best_of, 샘플링(T>0)에서는 beam_size 사용 불가
+            beam_size=options.get('beam_size') if temperature == 0 else None,
+            best_of=options.get('best_of') if temperature > 0 else None,
+            without_timestamps=options.get('without_timestamps', True),
+        )
+        decoded = whisper.decode(_model, mel, decode_options)
+
+        # transcribe()와 같은 무음 판정: 무음 확률이 높고 평균 logprob가 낮으면 빈 텍스트
+        # (무음 구간에서 "감사합니다" 같은 환각 방지)
+        text = decoded.text
+        no_speech_threshold = options.get('no_speech_threshold', 0.6)
+        logprob_threshold = options.get('logprob_threshold', -1.0)
+        if (
+            no_speech_threshold is not None
+            and decoded.no_speech_prob > no_speech_threshold
+            and (logprob_threshold is None or decoded.avg_logprob < logprob_threshold)
+        ):
+            text = ''
+
+        return {
+            'text': text,
+            'language': decoded.language,
+            'segments': [{'no_speech_prob': decoded.no_speech_prob}],
+        }
+
     @staticmethod
     def is_loaded() -> bool:
         """모델 로드 상태 확인"""
         return _model_loaded
+
+    @staticmethod
+    def load_source():
+        """모델을 어디서 로드했는지 ('checkpoint' / 'mmap-cache' / 'mmap-cache (built)', 미로드 시 None)"""
+        return _model_source
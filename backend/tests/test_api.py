@@ -50,6 +50,46 @@ class TestAnalyzeEndpoint(unittest.TestCase):
         )
         self.assertEqual(response.status_code, 400)
 
+    def test_unknown_profile_returns_400(self):
+        """POST /api/analyze 알 수 없는 프로파일 지정 시 400"""
+        from io import BytesIO
+        data = {'audio': (BytesIO(b'x' * 200), 'test.webm'), 'profile': 'turbo'}
+        response = self.client.post(
+            '/api/analyze',
+            data=data,
+            content_type='multipart/form-data'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.data)['error']['code'], 'INVALID_PROFILE')
+
+
+class TestCancelEndpoint(unittest.TestCase):
+    """분석 취소 엔드포인트 테스트"""
+
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+    def test_cancel_without_ids_returns_400(self):
+        """POST /api/analyze/cancel ID 없이 요청 시 400"""
+        response = self.client.post('/api/analyze/cancel', json={})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cancel_unknown_session(self):
+        """진행 중이 아닌 세션 취소 시 0건"""
+        response = self.client.post('/api/analyze/cancel', json={'sessionId': 'nope'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data)['cancelled'], 0)
+
+    def test_cancel_beacon_text_plain(self):
+        """sendBeacon(text/plain) 형식도 파싱"""
+        response = self.client.post(
+            '/api/analyze/cancel',
+            data=json.dumps({'requestId': 'abc'}),
+            content_type='text/plain',
+        )
+        self.assertEqual(response.status_code, 200)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,147 @@
+"""
+TTS 오디오 메모리 저장소 / 서빙 테스트
+"""
+import json
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from config import Config
+from services.audio_store import AudioStore
+
+AUDIO_BYTES = bytes(range(256)) * 4
+
+
+class TestAudioStore(unittest.TestCase):
+    """저장소 동작 테스트"""
+
+    def test_stream_while_synthesizing(self):
+        """합성 중인 오디오도 청크 순서대로 스트리밍"""
+        audio_id = AudioStore.create()
+        AudioStore.append(audio_id, b'ab')
+
+        def produce():
+            AudioStore.append(audio_id, b'cd')
+            AudioStore.finish(audio_id)
+
+        threading.Timer(0.05, produce).start()
+        self.assertEqual(b''.join(AudioStore.stream(audio_id)), b'abcd')
+        AudioStore.discard(audio_id)
+
+    def test_stream_resumes_after_finish(self):
+        """합성 중 일부를 받은 스트림은 완료 후 나머지 바이트만 이어서 전달"""
+        audio_id = AudioStore.create()
+        AudioStore.append(audio_id, b'ab')
+        stream = AudioStore.stream(audio_id)
+        self.assertEqual(next(stream), b'ab')
+        AudioStore.append(audio_id, b'cd')
+        AudioStore.finish(audio_id)
+        self.assertEqual(b''.join(stream), b'cd')
+        AudioStore.discard(audio_id)
+
+    def test_finish_joins_payload_once(self):
+        """완료 시 청크를 한 번만 합쳐 보관"""
+        audio_id = AudioStore.create()
+        AudioStore.append(audio_id, b'ab')
+        AudioStore.append(audio_id, b'cd')
+        AudioStore.finish(audio_id)
+        entry = AudioStore.get(audio_id)
+        self.assertEqual(entry.payload, b'abcd')
+        self.assertEqual(entry.chunks, [])
+        self.assertIs(entry.data(), entry.payload)
+        AudioStore.discard(audio_id)
+
+    def test_failed_synthesis_is_discarded(self):
+        audio_id = AudioStore.create()
+        AudioStore.finish(audio_id, error='network')
+        self.assertIsNone(AudioStore.get(audio_id))
+
+    def test_byte_budget_evicts_oldest(self):
+        """용량 초과 시 오래된 항목부터 제거"""
+        with mock.patch.object(Config, 'AUDIO_STORE_MAX_BYTES', AudioStore.stats()['bytes'] + 1500):
+            first, second = AudioStore.create(), AudioStore.create()
+            for audio_id in (first, second):
+                AudioStore.append(audio_id, AUDIO_BYTES)
+                AudioStore.finish(audio_id)
+            self.assertIsNone(AudioStore.get(first))
+            self.assertIsNotNone(AudioStore.get(second))
+        AudioStore.discard(second)
+
+    def test_ttl_expiry(self):
+        audio_id = AudioStore.create()
+        AudioStore.append(audio_id, b'x')
+        AudioStore.finish(audio_id)
+        with mock.patch.object(Config, 'AUDIO_STORE_TTL', -1):
+            self.assertIsNone(AudioStore.get(audio_id))
+
+
+class TestAudioEndpoint(unittest.TestCase):
+    """GET /api/audio/<id> 테스트"""
+
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+        self.audio_id = AudioStore.create()
+        AudioStore.append(self.audio_id, AUDIO_BYTES)
+        AudioStore.finish(self.audio_id)
+        self.addCleanup(AudioStore.discard, self.audio_id)
+
+    def test_full_response_has_cache_headers(self):
+        response = self.client.get(f'/api/audio/{self.audio_id}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, AUDIO_BYTES)
+        self.assertEqual(response.mimetype, 'audio/mpeg')
+        self.assertTrue(response.headers['ETag'])
+        self.assertIn('max-age', response.headers['Cache-Control'])
+        self.assertEqual(response.headers['Accept-Ranges'], 'bytes')
+
+    def test_etag_returns_304(self):
+        etag = self.client.get(f'/api/audio/{self.audio_id}').headers['ETag']
+        response = self.client.get(f'/api/audio/{self.audio_id}', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_range_request(self):
+        response = self.client.get(f'/api/audio/{self.audio_id}', headers={'Range': 'bytes=10-19'})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.data, AUDIO_BYTES[10:20])
+        self.assertEqual(response.headers['Content-Range'], f'bytes 10-19/{len(AUDIO_BYTES)}')
+
+    def test_streams_incomplete_audio(self):
+        """합성 중인 오디오는 캐시 없이 스트리밍"""
+        audio_id = AudioStore.create()
+        AudioStore.append(audio_id, b'partial')
+        threading.Timer(0.05, AudioStore.finish, args=(audio_id,)).start()
+        response = self.client.get(f'/api/audio/{audio_id}')
+        self.assertEqual(response.data, b'partial')
+        self.assertEqual(response.headers['Cache-Control'], 'no-store')
+        AudioStore.discard(audio_id)
+
+    def test_spilled_audio_served_from_disk(self):
+        """용량 초과로 디스크에 spill된 오디오도 서빙"""
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.multiple(Config, UPLOAD_FOLDER=tmp, AUDIO_SPILL_TO_DISK=True, AUDIO_STORE_MAX_BYTES=0):
+            audio_id = AudioStore.create()
+            AudioStore.append(audio_id, AUDIO_BYTES)
+            AudioStore.finish(audio_id)
+            self.assertIsNone(AudioStore.get(audio_id))
+
+            response = self.client.get(f'/api/audio/{audio_id}', headers={'Range': 'bytes=0-9'})
+            self.assertEqual(response.status_code, 206)
+            self.assertEqual(response.data, AUDIO_BYTES[:10])
+            response.close()
+
+    def test_unknown_id_returns_404(self):
+        response = self.client.get('/api/audio/unknown')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(json.loads(response.data)['error']['code'], 'NOT_FOUND')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Batch Analyze CLI 테스트
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import batch_analyze
+from batch_analyze import find_audio_files, load_processed, run_batch
+from services import ollama_service
+
+REAL_ANALYZE_EMOTION = batch_analyze._analyze_emotion  # setUp에서 mock되기 전 원본
+
+
+class TestBatchResume(unittest.TestCase):
+    """파일 탐색 및 이어하기 테스트"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_find_audio_files(self):
+        """오디오 확장자만 재귀적으로 찾음"""
+        os.makedirs(os.path.join(self.root, 'session1'))
+        for name in ['a.wav', 'session1/b.WEBM', 'notes.txt']:
+            with open(os.path.join(self.root, name), 'wb') as f:
+                f.write(b'x')
+        self.assertEqual(find_audio_files(self.root), ['a.wav', 'session1/b.WEBM'])
+
+    def test_load_processed_skips_errors_and_truncated_lines(self):
+        """실패 기록과 잘린 마지막 줄은 처리 완료로 보지 않음"""
+        output_path = os.path.join(self.root, 'results.jsonl')
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'file': 'a.wav', 'emotion': 'happy'}) + '\n')
+            f.write(json.dumps({'file': 'b.wav', 'error': 'ffmpeg 에러'}) + '\n')
+            f.write('{"file": "c.wa')
+        self.assertEqual(load_processed(output_path), {'a.wav'})
+
+    def test_load_processed_missing_file(self):
+        """결과 파일이 없으면 빈 집합"""
+        self.assertEqual(load_processed(os.path.join(self.root, 'none.jsonl')), set())
+
+
+class TestRunBatch(unittest.TestCase):
+    """run_batch 이어하기 테스트 (STT/LLM은 mock, 프로세스 풀 대신 스레드 풀)"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.input_dir = os.path.join(self.tmp.name, 'audio')
+        os.makedirs(self.input_dir)
+        for name in ['a.wav', 'b.wav', 'c.wav']:
+            with open(os.path.join(self.input_dir, name), 'wb') as f:
+                f.write(b'x')
+        self.output_path = os.path.join(self.tmp.name, 'results.jsonl')
+
+        for target, value in [
+            ('ProcessPoolExecutor', ThreadPoolExecutor),
+            ('_init_worker', lambda: None),
+            ('_transcribe_file', lambda input_dir, rel_path, profile=None: {'text': rel_path, 'stt_time': 0.0}),
+            ('_analyze_emotion', lambda stt_result: {'emotion': 'calm', 'llm_time': 0.0}),
+        ]:
+            patcher = mock.patch.object(batch_analyze, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_resume_after_truncated_line(self):
+        """잘린 마지막 줄을 정리하고 남은 파일만 이어서 기록"""
+        with open(self.output_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'file': 'a.wav', 'emotion': 'happy'}) + '\n')
+            f.write('{"file": "b.wa')
+
+        stats = run_batch(self.input_dir, self.output_path, workers=1, llm_concurrency=1)
+        self.assertEqual((stats['total'], stats['skipped'], stats['processed'], stats['failed']), (3, 1, 2, 0))
+
+        with open(self.output_path, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(sorted(r['file'] for r in records), ['a.wav', 'b.wav', 'c.wav'])
+
+        # 재실행 시 모두 건너뜀
+        stats = run_batch(self.input_dir, self.output_path, workers=1, llm_concurrency=1)
+        self.assertEqual((stats['skipped'], stats['processed']), (3, 0))
+
+    def test_llm_failure_is_retried_on_resume(self):
+        """LLM 장애 시 기본값(neutral)이 아닌 에러로 기록되어 재실행 시 다시 분석"""
+        ollama_service._emotion_cache.clear()
+        self.addCleanup(ollama_service._emotion_cache.clear)
+        with mock.patch.object(batch_analyze, '_analyze_emotion', REAL_ANALYZE_EMOTION), \
+                mock.patch('services.ollama_service.ollama_client.chat', side_effect=ConnectionError):
+            stats = run_batch(self.input_dir, self.output_path, workers=1, llm_concurrency=1)
+        self.assertEqual((stats['processed'], stats['failed']), (0, 3))
+        self.assertEqual(load_processed(self.output_path), set())
+
+        response = {'message': {'content': '{"emotion": "calm", "intensity": 0.4, "state": "speaking", "keywords": []}'}}
+        with mock.patch.object(batch_analyze, '_analyze_emotion', REAL_ANALYZE_EMOTION), \
+                mock.patch('services.ollama_service.ollama_client.chat', return_value=response):
+            stats = run_batch(self.input_dir, self.output_path, workers=1, llm_concurrency=1)
+        self.assertEqual((stats['skipped'], stats['processed'], stats['failed']), (0, 3, 0))
+
+    def test_truncated_only_line(self):
+        """줄바꿈이 전혀 없는 잘린 파일은 비움"""
+        with open(self.output_path, 'w', encoding='utf-8') as f:
+            f.write('{"file": "a.w')
+        batch_analyze.repair_trailing_line(self.output_path)
+        self.assertEqual(os.path.getsize(self.output_path), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Pipeline Cancellation 테스트
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cancellation import PipelineCancellation, PipelineCancelled
+
+
+class TestCancelToken(unittest.TestCase):
+    """취소 토큰 테스트"""
+
+    def test_cancel_by_session_raises_at_next_stage(self):
+        """세션 ID로 취소하면 다음 단계 시작 시 PipelineCancelled"""
+        token = PipelineCancellation.register('req-1', 'sess-1')
+        try:
+            token.begin_stage('stt')
+            self.assertEqual(PipelineCancellation.cancel(session_id='sess-1'), 1)
+            with self.assertRaises(PipelineCancelled) as ctx:
+                token.begin_stage('emotion')
+            self.assertEqual(ctx.exception.stage, 'emotion')
+            self.assertEqual(ctx.exception.reason, 'client')
+        finally:
+            PipelineCancellation.unregister(token)
+
+    def test_disconnect_check_cancels(self):
+        """연결 끊김 감지 시 disconnect 사유로 취소"""
+        token = PipelineCancellation.register('req-2', disconnect_check=lambda: True)
+        try:
+            with self.assertRaises(PipelineCancelled):
+                token.check()
+            self.assertEqual(token.reason, 'disconnect')
+        finally:
+            PipelineCancellation.unregister(token)
+
+    def test_saved_time_counts_remaining_stages(self):
+        """절약 시간 = 취소된 단계 이후 단계들의 평균 시간"""
+        for stage in ('emotion', 'response', 'tts'):
+            PipelineCancellation.record_stage(stage, 1.0)
+        before = PipelineCancellation.stats()
+
+        token = PipelineCancellation.register('req-3')
+        token.cancel()
+        with self.assertRaises(PipelineCancelled):
+            token.begin_stage('response')
+        saved = PipelineCancellation.record_cancelled(token)
+        PipelineCancellation.unregister(token)
+
+        self.assertGreaterEqual(saved, 1.0)
+        after = PipelineCancellation.stats()
+        self.assertEqual(after['cancelled'], before['cancelled'] + 1)
+
+
+class TestOllamaStreamAbort(unittest.TestCase):
+    """Ollama 스트리밍 생성 중단 테스트"""
+
+    def test_generate_response_aborts_mid_stream(self):
+        """스트리밍 도중 취소되면 스트림을 닫고 PipelineCancelled 전파"""
+        from services.ollama_service import OllamaService
+
+        token = PipelineCancellation.register('req-4')
+        consumed = []
+
+        def chunks():
+            for word in ['안녕', '하세요', '반가워요']:
+                consumed.append(word)
+                if len(consumed) == 2:
+                    token.cancel()
+                yield {'message': {'content': word}}
+
+        try:
+            with mock.patch('services.ollama_service.ollama_client.chat', return_value=chunks()):
+                with self.assertRaises(PipelineCancelled):
+                    OllamaService.generate_response('안녕', cancel_token=token)
+            self.assertEqual(consumed, ['안녕', '하세요'])
+        finally:
+            PipelineCancellation.unregister(token)
+
+
+
+class TestTtsCancel(unittest.TestCase):
+    """백그라운드 TTS 합성 취소 테스트 (edge_tts 모듈 mock)"""
+
+    def setUp(self):
+        self.edge_tts = mock.MagicMock()
+        patcher = mock.patch.dict(sys.modules, {'edge_tts': self.edge_tts})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sys.modules.pop('services.tts_service', None)
+        from services.tts_service import TtsService
+        self.TtsService = TtsService
+
+    def _fake_stream(self, chunks, on_chunk=None):
+        async def stream():
+            for index, chunk in enumerate(chunks):
+                if on_chunk:
+                    on_chunk(index)
+                yield {'type': 'audio', 'data': chunk}
+        self.edge_tts.Communicate.return_value.stream = stream
+
+    def test_session_cancel_stops_synthesis(self):
+        """응답 후에도 세션 취소로 합성 중단, 토큰은 합성 종료 시 해제"""
+        from services.audio_store import AudioStore
+
+        token = PipelineCancellation.register('req-tts-1', 'sess-tts')
+        token.begin_stage('tts')
+        token.detach_disconnect()
+        self._fake_stream([b'a', b'b', b'c'],
+                          on_chunk=lambda i: i == 1 and PipelineCancellation.cancel(session_id='sess-tts'))
+        before = PipelineCancellation.stats()['cancelled']
+
+        audio_id = AudioStore.create()
+        self.TtsService._synthesize('안녕하세요', audio_id, token)
+
+        self.assertIsNone(AudioStore.get(audio_id))
+        self.assertEqual(PipelineCancellation.stats()['cancelled'], before + 1)
+        self.assertEqual(PipelineCancellation.cancel(request_id='req-tts-1'), 0)
+
+    def test_completed_synthesis_records_tts_stage(self):
+        """합성 완료 시 실제 합성 시간이 tts 단계로 기록되고 토큰 해제"""
+        from services.audio_store import AudioStore
+
+        token = PipelineCancellation.register('req-tts-2')
+        token.begin_stage('tts')
+        self._fake_stream([b'ab', b'cd'])
+
+        with mock.patch.object(PipelineCancellation, 'record_stage') as record_stage:
+            audio_id = AudioStore.create()
+            self.TtsService._synthesize('안녕하세요', audio_id, token)
+        record_stage.assert_called_once()
+        self.assertEqual(record_stage.call_args[0][0], 'tts')
+        self.assertEqual(AudioStore.get(audio_id).data(), b'abcd')
+        self.assertEqual(PipelineCancellation.cancel(request_id='req-tts-2'), 0)
+        AudioStore.discard(audio_id)
+
+    def test_detached_token_ignores_disconnect(self):
+        """응답 전송 후 연결 종료는 TTS 취소 사유가 아님"""
+        token = PipelineCancellation.register('req-tts-3', disconnect_check=lambda: True)
+        token.detach_disconnect()
+        self.assertFalse(token.is_cancelled())
+        PipelineCancellation.unregister(token)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+"""
+감정 분석 빠른 경로 (키워드 사전 + 캐시) 테스트
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from services import ollama_service
+from services.emotion_lexicon import EmotionLexicon
+from services.ollama_service import OllamaService
+
+
+class TestEmotionLexicon(unittest.TestCase):
+    """로컬 키워드 사전 테스트"""
+
+    def test_obvious_utterance_is_confident(self):
+        """명확한 발화는 높은 확신도"""
+        result = EmotionLexicon.score('오늘 정말 짜증나')
+        self.assertEqual(result['emotion'], 'angry')
+        self.assertIn('짜증', result['keywords'])
+        self.assertGreaterEqual(result['confidence'], 0.9)
+        self.assertGreater(result['intensity'], 0.7)
+
+    def test_negation_is_ignored(self):
+        """부정된 키워드는 무시 (앞: 안/못, 뒤: -지(는/도/가) 않/-지 못/안/아니)"""
+        cases = {
+            '기분이 안 좋아': 'happy',
+            '기쁘지 않아': 'happy',
+            '행복하지 않아': 'happy',
+            '슬프지 않아': 'sad',
+            '우울하지 않아': 'sad',
+            '짜증 안 나': 'angry',
+            '행복하지는 않아': 'happy',
+            '기쁘지가 않아': 'happy',
+            '즐겁지도 않아': 'happy',
+            '행복한 게 아니야': 'happy',
+            '대박 망했다': 'excited',
+        }
+        for text, negated in cases.items():
+            with self.subTest(text=text):
+                result = EmotionLexicon.score(text)
+                self.assertFalse(result['emotion'] == negated and result['confidence'] > 0)
+
+    def test_particle_wa_is_not_excitement(self):
+        """조사/감탄사 "와"는 감정 키워드가 아님"""
+        result = EmotionLexicon.score('와 진짜 짜증나')
+        self.assertEqual(result['emotion'], 'angry')
+        self.assertGreaterEqual(result['confidence'], Config.EMOTION_FASTPATH_THRESHOLD)
+        self.assertNotEqual(EmotionLexicon.score('너와 나와 함께 가자')['emotion'], 'excited')
+
+    def test_later_affirmed_occurrence_counts(self):
+        """첫 등장만 부정이면 뒤의 긍정 등장은 반영"""
+        result = EmotionLexicon.score('처음엔 행복하지 않았는데 지금은 행복해')
+        self.assertEqual(result['emotion'], 'happy')
+
+    def test_mixed_signals_are_unsure(self):
+        """상반된 감정이 섞이면 확신도 낮음"""
+        self.assertLess(EmotionLexicon.score('행복한데 좀 슬퍼')['confidence'], 0.6)
+
+    def test_no_match_is_neutral(self):
+        result = EmotionLexicon.score('내일 회의는 세 시야')
+        self.assertEqual(result['emotion'], 'neutral')
+        self.assertEqual(result['confidence'], 0.0)
+
+
+class TestTieredAnalyzer(unittest.TestCase):
+    """캐시 → 사전 → LLM 단계 테스트"""
+
+    def setUp(self):
+        patchers = [
+            mock.patch.dict(ollama_service._emotion_stats, {k: 0 for k in ollama_service._emotion_stats}),
+            mock.patch.object(Config, 'EMOTION_AUDIT_RATE', 0.0),  # 샘플 감사 스레드 비활성화
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        ollama_service._emotion_cache.clear()
+        self.addCleanup(ollama_service._emotion_cache.clear)
+
+    def test_fast_path_skips_llm_and_memoizes(self):
+        """확신도가 높으면 LLM 호출 없이 처리, 같은 문장은 캐시"""
+        with mock.patch('services.ollama_service.ollama_client.chat') as chat:
+            first = OllamaService.analyze_emotion('와 드디어 됐다!')
+            second = OllamaService.analyze_emotion('  와 드디어   됐다! ')
+            chat.assert_not_called()
+        self.assertEqual(first['emotion'], 'excited')
+        self.assertEqual(first, second)
+        self.assertNotIn('confidence', first)
+
+        stats = OllamaService.emotion_stats()
+        self.assertEqual(stats['fast_path'], 1)
+        self.assertEqual(stats['cache_hits'], 1)
+        self.assertEqual(stats['fast_path_hit_rate'], 0.5)
+
+    def test_low_confidence_falls_back_to_llm(self):
+        """확신도가 낮으면 LLM 호출 후 일치도 기록"""
+        response = {'message': {'content': '{"emotion": "sad", "intensity": 0.6, "state": "speaking", "keywords": ["슬퍼"]}'}}
+        with mock.patch('services.ollama_service.ollama_client.chat', return_value=response) as chat:
+            result = OllamaService.analyze_emotion('행복한데 좀 슬퍼')
+            chat.assert_called_once()
+        self.assertEqual(result['emotion'], 'sad')
+
+        stats = OllamaService.emotion_stats()
+        self.assertEqual(stats['llm_calls'], 1)
+        self.assertEqual(stats['fallback_compared'], 1)
+        self.assertEqual(stats['audit_compared'], 0)
+
+    def test_fast_path_audit_reported_separately(self):
+        """빠른 경로 샘플 감사 결과는 fast_path_agreement로 집계"""
+        response = {'message': {'content': '{"emotion": "excited", "intensity": 0.8, "state": "speaking", "keywords": []}'}}
+        with mock.patch('services.ollama_service.ollama_client.chat', return_value=response):
+            OllamaService._audit_fast_path('와 드디어 됐다!', 'excited')
+            OllamaService._audit_fast_path('와 드디어 됐다!', 'happy')
+        stats = OllamaService.emotion_stats()
+        self.assertEqual(stats['fast_path_agreement'], 0.5)
+        self.assertIsNone(stats['fallback_agreement'])
+
+    def test_llm_failure_is_not_cached(self):
+        """LLM 실패 결과는 캐시하지 않음"""
+        with mock.patch('services.ollama_service.ollama_client.chat', side_effect=ConnectionError):
+            self.assertEqual(OllamaService.analyze_emotion('내일 회의는 세 시야')['emotion'], 'neutral')
+        self.assertEqual(len(ollama_service._emotion_cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,219 @@
+"""
+Whisper 디코딩 프로파일 테스트
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from services import whisper_service
+from services.whisper_service import WhisperService
+from bench_whisper_profiles import agreement
+
+try:
+    import torch
+    import whisper
+except ImportError:
+    torch = whisper = None
+
+
+class TestWhisperProfiles(unittest.TestCase):
+    """프로파일 선택 테스트"""
+
+    def setUp(self):
+        self.model = mock.Mock()
+        self.model.transcribe.return_value = {'text': ' 안녕하세요 ', 'segments': [{'no_speech_prob': 0.1}]}
+        patcher = mock.patch.multiple(whisper_service, _model=self.model, _model_loaded=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unknown_profile_raises(self):
+        """알 수 없는 프로파일은 ValueError"""
+        with self.assertRaises(ValueError):
+            WhisperService.get_profile('turbo')
+
+    def test_profile_options_passed_to_transcribe(self):
+        """프로파일 옵션이 transcribe에 전달됨 (single_window 제외)"""
+        result = WhisperService.transcribe('clip.wav', profile='accurate')
+        kwargs = self.model.transcribe.call_args.kwargs
+        self.assertEqual(kwargs['beam_size'], 5)
+        self.assertTrue(kwargs['condition_on_previous_text'])
+        self.assertNotIn('single_window', kwargs)
+        self.assertEqual(result['text'], '안녕하세요')
+        self.assertEqual(result['profile'], 'accurate')
+
+    def test_profiles_are_not_mutated(self):
+        """transcribe 호출이 Config 프로파일을 변경하지 않음"""
+        before = dict(Config.WHISPER_PROFILES['balanced'])
+        WhisperService.transcribe('clip.wav', profile='balanced')
+        self.assertEqual(Config.WHISPER_PROFILES['balanced'], before)
+
+
+class TestSingleWindowDecode(unittest.TestCase):
+    """realtime 프로파일 단일 윈도우 디코딩 테스트 (whisper 모듈 mock)"""
+
+    def setUp(self):
+        self.whisper = mock.MagicMock()
+        self.whisper.audio.N_SAMPLES = 480000
+        self.whisper.load_audio.return_value = [0.0] * 16000
+        patchers = [
+            mock.patch.dict(sys.modules, {'whisper': self.whisper}),
+            mock.patch.multiple(whisper_service, _model=mock.Mock(), _model_loaded=True),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _decoded(self, text, no_speech_prob, avg_logprob):
+        self.whisper.decode.return_value = mock.Mock(
+            text=text, language='ko', no_speech_prob=no_speech_prob, avg_logprob=avg_logprob,
+        )
+
+    def test_silence_returns_empty_text(self):
+        """무음 확률이 높고 logprob가 낮으면 환각 텍스트 대신 빈 텍스트"""
+        self._decoded('감사합니다.', no_speech_prob=0.9, avg_logprob=-1.5)
+        result = WhisperService.transcribe('silence.wav', profile='realtime')
+        self.assertEqual(result['text'], '')
+        self.whisper.decode.assert_called_once()
+
+    def test_speech_is_kept(self):
+        self._decoded('오늘 정말 짜증나', no_speech_prob=0.9, avg_logprob=-0.3)
+        result = WhisperService.transcribe('speech.wav', profile='realtime')
+        self.assertEqual(result['text'], '오늘 정말 짜증나')
+
+
+class TestAgreement(unittest.TestCase):
+    """전사 일치도 계산 테스트"""
+
+    def test_ignores_spacing_and_punctuation(self):
+        self.assertEqual(agreement('오늘 정말 짜증나!', '오늘정말 짜증나'), 1.0)
+
+    def test_partial_match(self):
+        self.assertLess(agreement('오늘 정말', '오늘 정말 짜증나'), 1.0)
+
+
+
+class TestMmapCache(unittest.TestCase):
+    """Whisper mmap 가중치 캐시 키 / 무효화 테스트"""
+
+    def test_cache_key_changes_with_versions(self):
+        base = whisper_service._cache_key('small', 'abc123', '20240930', '2.4.1+cpu')
+        self.assertEqual(base, whisper_service._cache_key('small', 'abc123', '20240930', '2.4.0'))
+        self.assertNotEqual(base, whisper_service._cache_key('small', 'abc123', '20250625', '2.4.1'))
+        self.assertNotEqual(base, whisper_service._cache_key('small', 'def456', '20240930', '2.4.1'))
+        self.assertNotEqual(base, whisper_service._cache_key('base', 'abc123', '20240930', '2.4.1'))
+
+    def test_prune_removes_only_stale_files_of_same_model(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as cache_dir:
+            current = whisper_service._cache_key('large-v3', 'new', '20240930', '2.4')
+            names = [
+                current,
+                whisper_service._cache_key('large-v3', 'old', '20240930', '2.4'),
+                whisper_service._cache_key('large-v3-turbo', 'x', '20240930', '2.4'),
+            ]
+            for name in names:
+                open(os.path.join(cache_dir, f'{name}.pt'), 'wb').close()
+
+            whisper_service._prune_stale_cache(cache_dir, 'large-v3', current)
+            remaining = sorted(os.listdir(cache_dir))
+            self.assertEqual(remaining, sorted([f'{names[0]}.pt', f'{names[2]}.pt']))
+
+    def test_load_source_reports_checkpoint_fallback(self):
+        """mmap 캐시 로드 실패 시 폴백한 경로가 load_source에 기록됨"""
+        fake_whisper = mock.MagicMock()
+        with mock.patch.dict(sys.modules, {'whisper': fake_whisper}), \
+                mock.patch.multiple(whisper_service, _model=None, _model_loaded=False, _model_source=None), \
+                mock.patch.object(Config, 'WHISPER_MMAP_CACHE', True), \
+                mock.patch.object(WhisperService, '_load_from_mmap_cache', side_effect=RuntimeError('broken')):
+            WhisperService._load_model()
+            self.assertEqual(WhisperService.load_source(), 'checkpoint')
+            fake_whisper.load_model.assert_called_once()
+
+    def test_concurrent_cold_start_builds_once(self):
+        """동시에 시작한 프로세스들이 캐시를 한 번만 만들고 나머지는 잠금 후 재사용"""
+        import tempfile
+        import threading
+        import time
+
+        fake_torch, fake_whisper = mock.MagicMock(__version__='2.4.1'), mock.MagicMock(__version__='20240930')
+        builds = []
+
+        def build(model_name, cache_path):
+            builds.append(model_name)
+            time.sleep(0.2)  # 변환 중 다른 프로세스가 잠금에서 대기하도록
+            open(cache_path, 'wb').close()
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.dict(sys.modules, {'torch': fake_torch, 'whisper': fake_whisper}), \
+                mock.patch.object(Config, 'WHISPER_CACHE_DIR', cache_dir), \
+                mock.patch.object(WhisperService, '_checkpoint_id', return_value='test'), \
+                mock.patch.object(WhisperService, '_build_mmap_cache', side_effect=build), \
+                mock.patch.object(WhisperService, '_model_from_checkpoint'):
+            sources = []
+            threads = [
+                threading.Thread(target=lambda: sources.append(WhisperService._load_from_mmap_cache('small')[1]))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            leftovers = [name for name in os.listdir(cache_dir) if name.endswith('.lock')]
+
+        self.assertEqual(len(builds), 1)
+        self.assertEqual(sorted(sources), ['mmap-cache'] * 3 + ['mmap-cache (built)'])
+        self.assertEqual(leftovers, [])
+
+    def test_stale_cache_lock_is_removed(self):
+        """중단된 프로세스가 남긴 오래된 잠금은 제거 후 진행"""
+        import tempfile
+        with tempfile.TemporaryDirectory() as cache_dir:
+            lock_path = os.path.join(cache_dir, 'x.pt.lock')
+            open(lock_path, 'w').close()
+            old = os.path.getmtime(lock_path) - whisper_service._CACHE_LOCK_STALE_SECONDS - 1
+            os.utime(lock_path, (old, old))
+            with whisper_service._cache_lock(lock_path, poll_interval=0.01):
+                self.assertTrue(os.path.exists(lock_path))
+            self.assertFalse(os.path.exists(lock_path))
+
+    @unittest.skipUnless(torch is not None, 'torch / openai-whisper 미설치')
+    def test_mmap_round_trip_matches_checkpoint(self):
+        """작은 Whisper 모델을 캐시로 변환 → mmap 로드 후 가중치/비영속 버퍼 비교"""
+        import tempfile
+        from whisper.model import ModelDimensions, Whisper
+
+        dims = ModelDimensions(
+            n_mels=80, n_audio_ctx=8, n_audio_state=16, n_audio_head=2, n_audio_layer=1,
+            n_vocab=64, n_text_ctx=8, n_text_state=16, n_text_head=2, n_text_layer=2,
+        )
+        original = Whisper(dims)
+        # 디코더 positional_embedding은 torch.empty로 생성되어 NaN이 섞일 수 있음 (NaN != NaN)
+        torch.nn.init.normal_(original.decoder.positional_embedding)
+
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(Config, 'WHISPER_CACHE_DIR', cache_dir), \
+                mock.patch.object(whisper, 'load_model', return_value=original), \
+                mock.patch.object(WhisperService, '_checkpoint_id', return_value='test'):
+            _, source = WhisperService._load_from_mmap_cache('tiny-test')
+            self.assertEqual(source, 'mmap-cache (built)')
+            loaded, source = WhisperService._load_from_mmap_cache('tiny-test')
+            self.assertEqual(source, 'mmap-cache')
+
+            expected, actual = original.state_dict(), loaded.state_dict()
+            self.assertEqual(sorted(actual), sorted(expected))
+            for name, tensor in expected.items():
+                self.assertTrue(torch.equal(actual[name].cpu(), tensor), name)
+
+            self.assertTrue(loaded.alignment_heads.is_sparse)
+            self.assertTrue(torch.equal(loaded.alignment_heads.cpu().to_dense(),
+                                        original.alignment_heads.to_dense()))
+            self.assertTrue(torch.equal(loaded.decoder.mask.cpu(), original.decoder.mask))
+
+
+if __name__ == '__main__':
+    unittest.main()
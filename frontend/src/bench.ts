@@ -0,0 +1,178 @@
+/* ============================================
+   Particle Benchmark Entry Point
+   파티클 수별 FPS / 프레임 시간 측정 (GPU 쉐이더 vs CPU 변위)
+   - gpu: 쉐이더가 위치 변위 계산 (정적 버퍼)
+   - cpu: 같은 변위(displaceParticlesCpu)를 매 프레임 JS에서 계산해 버퍼 재업로드,
+          쉐이더의 변위 uniform(uNoiseAmp / uAudioLow / uAudioHigh / uColorShift)은 0
+   ============================================ */
+import * as THREE from 'three';
+import { SCENE_CONFIG, PARTICLE_CONFIG } from './utils/constants';
+import type { FaceParticleData } from './modules/faceParticles';
+import { createParticleGeometry, createParticleMaterial, displaceParticlesCpu } from './modules/particleShader';
+
+interface BenchResult {
+    mode: string;
+    count: number;
+    frames: number;
+    avgFps: number;
+    frameTimeMean: number;   // ms
+    frameTimeP95: number;    // ms
+    cpuUpdateMean: number;   // ms, 프레임당 update 단계 CPU 시간
+}
+
+const params = new URLSearchParams(location.search);
+const COUNT = Number(params.get('count') ?? 100000);
+const MODE = params.get('mode') === 'cpu' ? 'cpu' : 'gpu';
+const SECONDS = Number(params.get('seconds') ?? 10);
+const WARMUP_MS = 1000;
+const MODE_LABEL = MODE === 'cpu'
+    ? 'cpu (쉐이더와 같은 변위를 CPU에서 계산, 쉐이더 변위 uniform = 0)'
+    : 'gpu (쉐이더에서 변위 계산)';
+
+/** 얼굴 크기의 타원체 표면에 파티클 배치 (GLTF 없이 측정) */
+function createSyntheticData(count: number): FaceParticleData {
+    const positions = new Float32Array(count * 3);
+    const colors = new Float32Array(count * 3);
+    for (let i = 0; i < count; i++) {
+        const u = Math.random() * Math.PI * 2;
+        const v = Math.acos(2 * Math.random() - 1);
+        positions[i * 3] = 14 * Math.sin(v) * Math.cos(u);
+        positions[i * 3 + 1] = 20 * Math.cos(v) - 5;
+        positions[i * 3 + 2] = 12 * Math.sin(v) * Math.sin(u);
+        colors.set([0.5, 0.8, 1.0], i * 3);
+    }
+    return {
+        positions,
+        originalPositions: positions.slice(),
+        colors,
+        sizes: new Float32Array(count).fill(PARTICLE_CONFIG.BASE_SIZE),
+        count,
+    };
+}
+
+/** 가상 오디오 신호 (말하는 것처럼 변동) */
+function syntheticAudio(t: number) {
+    const bass = 0.5 + 0.5 * Math.sin(t * 6.0);
+    const mid = 0.5 + 0.5 * Math.sin(t * 9.0 + 1.0);
+    const treble = 0.5 + 0.5 * Math.sin(t * 13.0 + 2.0);
+    return { bass, mid, treble, volume: (bass + mid + treble) / 3 };
+}
+
+function run(): void {
+    const statsEl = document.getElementById('bench-stats')!;
+
+    const scene = new THREE.Scene();
+    const camera = new THREE.PerspectiveCamera(
+        SCENE_CONFIG.CAMERA_FOV, window.innerWidth / window.innerHeight,
+        SCENE_CONFIG.CAMERA_NEAR, SCENE_CONFIG.CAMERA_FAR
+    );
+    camera.position.set(0, 0, SCENE_CONFIG.CAMERA_Z);
+
+    const renderer = new THREE.WebGLRenderer({ antialias: true, powerPreference: 'high-performance' });
+    renderer.setSize(window.innerWidth, window.innerHeight);
+    renderer.setPixelRatio(Math.min(window.devicePixelRatio, 2));
+    document.body.appendChild(renderer.domElement);
+
+    const data = createSyntheticData(COUNT);
+    const geometry = createParticleGeometry(data);
+    const material = createParticleMaterial();
+    const points = new THREE.Points(geometry, material);
+    points.frustumCulled = false;
+    scene.add(points);
+
+    // CPU 모드: 쉐이더 변위를 끄고 같은 변위를 매 프레임 JS에서 계산 후 재업로드 (이전 방식 비교용)
+    const positionAttr = geometry.getAttribute('position') as THREE.BufferAttribute;
+    if (MODE === 'cpu') {
+        positionAttr.setUsage(THREE.DynamicDrawUsage);
+    }
+    const base = (positionAttr.array as Float32Array).slice();
+
+    const frameTimes: number[] = [];
+    const updateTimes: number[] = [];
+    const start = performance.now();
+    let last = start;
+
+    const frame = (now: number) => {
+        const t = (now - start) / 1000;
+        const audio = syntheticAudio(t);
+
+        const updateStart = performance.now();
+        const uniforms = material.uniforms;
+        uniforms.uTime.value = t;
+        uniforms.uAudioLow.value = audio.bass;
+        uniforms.uAudioMid.value = audio.mid;
+        uniforms.uAudioHigh.value = audio.treble;
+        uniforms.uAudioVolume.value = audio.volume;
+        uniforms.uExpand.value = 1.0;
+
+        if (MODE === 'cpu') {
+            displaceParticlesCpu(base, positionAttr.array as Float32Array, {
+                time: t,
+                audioLow: audio.bass,
+                audioHigh: audio.treble,
+                speedScale: uniforms.uSpeedScale.value,
+                noiseAmp: 1.0,
+                expand: uniforms.uExpand.value,
+                colorShift: 0.0,
+            });
+            positionAttr.needsUpdate = true;
+            // 쉐이더에서는 변위를 다시 적용하지 않음 (크기/색상 계산은 그대로)
+            uniforms.uNoiseAmp.value = 0;
+            uniforms.uAudioLow.value = 0;
+            uniforms.uAudioHigh.value = 0;
+            uniforms.uColorShift.value = 0;
+        }
+        const updateEnd = performance.now();
+
+        renderer.render(scene, camera);
+
+        const elapsed = now - start;
+        if (elapsed > WARMUP_MS) {
+            frameTimes.push(now - last);
+            updateTimes.push(updateEnd - updateStart);
+        }
+        last = now;
+
+        if (frameTimes.length && frameTimes.length % 30 === 0) {
+            const recent = frameTimes.slice(-30);
+            const mean = recent.reduce((a, b) => a + b, 0) / recent.length;
+            statsEl.textContent = `mode: ${MODE_LABEL} / particles: ${COUNT.toLocaleString()}\n`
+                + `fps: ${(1000 / mean).toFixed(1)} / frame: ${mean.toFixed(2)} ms`;
+        }
+
+        if (elapsed < WARMUP_MS + SECONDS * 1000) {
+            requestAnimationFrame(frame);
+        } else {
+            report(statsEl, frameTimes, updateTimes);
+        }
+    };
+    requestAnimationFrame(frame);
+}
+
+function report(statsEl: HTMLElement, frameTimes: number[], updateTimes: number[]): void {
+    const mean = (xs: number[]) => xs.reduce((a, b) => a + b, 0) / Math.max(xs.length, 1);
+    const sorted = [...frameTimes].sort((a, b) => a - b);
+    const frameTimeMean = mean(frameTimes);
+
+    const result: BenchResult = {
+        mode: MODE,
+        count: COUNT,
+        frames: frameTimes.length,
+        avgFps: Number((1000 / frameTimeMean).toFixed(1)),
+        frameTimeMean: Number(frameTimeMean.toFixed(2)),
+        frameTimeP95: Number((sorted[Math.floor(sorted.length * 0.95)] ?? 0).toFixed(2)),
+        cpuUpdateMean: Number(mean(updateTimes).toFixed(3)),
+    };
+
+    statsEl.textContent = [
+        `mode: ${MODE_LABEL}`,
+        `particles: ${result.count.toLocaleString()} / frames: ${result.frames}`,
+        `avg fps: ${result.avgFps}`,
+        `frame time: mean ${result.frameTimeMean} ms / p95 ${result.frameTimeP95} ms`,
+        `cpu update: ${result.cpuUpdateMean} ms/frame`,
+    ].join('\n');
+    console.table(result);
+    (window as any).benchResult = result;
+}
+
+run();
@@ -8,7 +8,7 @@ import { Visualizer } from './modules/visualizer';
 import { ApiClient } from './modules/apiClient';
 import { MatrixBackground } from './modules/matrixBg';
 import { UIController } from './modules/uiController';
-import { AUDIO_CONFIG } from './utils/constants';
+import { AUDIO_CONFIG, type AnalyzeResponse } from './utils/constants';
 
 class App {
   private audioHandler = new AudioHandler();
@@ -18,6 +18,7 @@ class App {
   private ui = new UIController();
   private analyzeInterval: number | null = null;
   private isActive = false;
+  private bargeInAt: number | null = null; // 끼어든 발화 시작 시각 (녹음 진행 중)
 
   async start(): Promise<void> {
     console.log('🎯 Voice-Reactive 3D AI Visualizer 시작');
@@ -37,6 +38,9 @@ class App {
     // 마이크 버튼 핸들러
     this.ui.onMicClick(() => this.toggleMic());
 
+    // 탭 닫힘/이동 시 서버의 진행 중인 파이프라인 취소
+    window.addEventListener('pagehide', () => this.apiClient.cancelSession());
+
     // 애니메이션 루프 시작
     this.animate();
 
@@ -78,6 +82,9 @@ class App {
   /** 마이크 중지 */
   private stopListening(): void {
     this.isActive = false;
+    this.bargeInAt = null;
+    // 진행 중인 분석 + 응답 후 백그라운드에서 이어지는 TTS 합성까지 세션 단위로 취소
+    this.apiClient.cancelSession('mic_stop');
     this.audioHandler.dispose();
     this.ui.setMicActive(false);
 
@@ -97,8 +104,17 @@ class App {
         this.visualizer.setInteractionState('listening');
         this.ui.setProcessing(true); // UI 상에서는 마이크 활성 표시
 
-        // 5초 녹음
-        const blob = await this.audioHandler.recordForDuration(AUDIO_CONFIG.BUFFER_INTERVAL);
+        let blob: Blob;
+        if (this.bargeInAt !== null) {
+          // 끼어든 발화는 이미 녹음 중: 발화 시작부터 5초가 될 때까지 이어서 녹음
+          const remaining = AUDIO_CONFIG.BUFFER_INTERVAL - (performance.now() - this.bargeInAt);
+          this.bargeInAt = null;
+          await new Promise((r) => setTimeout(r, Math.max(0, remaining)));
+          blob = await this.audioHandler.stopRecording();
+        } else {
+          // 5초 녹음
+          blob = await this.audioHandler.recordForDuration(AUDIO_CONFIG.BUFFER_INTERVAL);
+        }
 
         if (blob.size < 1000) {
           // 묵음: 다시 듣기로
@@ -110,8 +126,14 @@ class App {
         this.visualizer.setInteractionState('thinking');
         console.log('[App] 분석 요청 전송...');
 
-        // 백엔드 분석 요청
-        const result = await this.apiClient.analyze(blob);
+        // 백엔드 분석 요청 (대기 중 사용자가 다시 말하면 취소)
+        const stopBargeInWatch = this.watchBargeIn();
+        let result: AnalyzeResponse;
+        try {
+          result = await this.apiClient.analyze(blob);
+        } finally {
+          stopBargeInWatch();
+        }
         console.log('[App] 분석 결과 수신:', result);
 
         if (result.success && result.data) {
@@ -150,6 +172,8 @@ class App {
               });
             }
           }
+        } else if (result.error?.code === 'CANCELLED') {
+          console.log('[App] 분석 취소됨 (끼어들기)');
         } else if (result.error) {
           console.warn('[App] 분석 에러:', result.error.code, result.error.message);
           this.ui.showError(`분석 오류: ${result.error.message}`);
@@ -170,12 +194,61 @@ class App {
       if (!this.isActive) return;
       await runAnalysis();
       if (this.isActive) {
-        setTimeout(loop, 500); // 0.5초 휴식 후 다음 턴
+        // 0.5초 휴식 후 다음 턴 (끼어든 발화가 녹음 중이면 바로 이어서 처리)
+        setTimeout(loop, this.bargeInAt !== null ? 0 : 500);
       }
     }
     loop();
   }
 
+  /**
+   * 분석 대기 중 끼어들기(사용자 재발화) 감지 → 진행 중인 요청 취소
+   * - 녹음 종료 직후 계속 말하는 중이면 취소하지 않도록, 잠시 조용해진 뒤에만 감지 시작
+   * - 감지 시작과 함께 녹음을 미리 켜 두어 끼어든 발화의 앞부분도 다음 턴에 포함
+   */
+  private watchBargeIn(): () => void {
+    let quietSince: number | null = null;
+    let loudSince: number | null = null;
+    let armed = false;
+    let bargedIn = false;
+
+    const timer = window.setInterval(() => {
+      const now = performance.now();
+      const { volume } = this.audioHandler.getFrequencyData();
+      const loud = volume >= AUDIO_CONFIG.BARGE_IN_VOLUME;
+
+      if (!armed) {
+        quietSince = loud ? null : (quietSince ?? now);
+        if (quietSince !== null && now - quietSince >= AUDIO_CONFIG.BARGE_IN_QUIET_GAP) {
+          armed = true;
+          this.audioHandler.startRecording();
+        }
+        return;
+      }
+
+      if (!loud) {
+        loudSince = null;
+        return;
+      }
+      loudSince ??= now;
+      if (now - loudSince >= AUDIO_CONFIG.BARGE_IN_HOLD) {
+        console.log('[App] 끼어들기 감지 → 분석 취소, 새 발화 녹음 계속');
+        bargedIn = true;
+        this.bargeInAt = loudSince;
+        this.apiClient.cancelPending('barge_in');
+        clearInterval(timer);
+      }
+    }, 50);
+
+    return () => {
+      clearInterval(timer);
+      // 끼어들기가 없었으면 미리 켠 녹음은 버림
+      if (armed && !bargedIn) {
+        void this.audioHandler.stopRecording();
+      }
+    };
+  }
+
   /** 애니메이션 루프 (60fps) */
   private animate = (): void => {
     requestAnimationFrame(this.animate);
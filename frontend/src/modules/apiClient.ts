@@ -5,16 +5,65 @@
 import { API_CONFIG, type AnalyzeResponse } from '../utils/constants';
 
 export class ApiClient {
+    /** 세션 ID (탭 단위, 서버 측 일괄 취소에 사용) */
+    readonly sessionId = crypto.randomUUID();
+    private pending: { requestId: string; controller: AbortController } | null = null;
+
     /** 오디오 분석 요청 */
     async analyze(audioBlob: Blob): Promise<AnalyzeResponse> {
         const formData = new FormData();
         formData.append('audio', audioBlob, 'recording.webm');
 
+        const requestId = crypto.randomUUID();
+        const controller = new AbortController();
+        this.pending = { requestId, controller };
+
+        try {
+            return await this.sendAnalyze(formData, requestId, controller.signal);
+        } finally {
+            if (this.pending?.requestId === requestId) {
+                this.pending = null;
+            }
+        }
+    }
+
+    /** 진행 중인 분석 요청 취소 (끼어들기 / 마이크 중지) */
+    cancelPending(reason: string = 'barge_in'): void {
+        if (!this.pending) return;
+        const { requestId, controller } = this.pending;
+        this.pending = null;
+
+        // 연결을 끊고(서버가 감지), 명시적 취소 요청도 전송
+        controller.abort();
+        fetch(API_CONFIG.CANCEL_ENDPOINT, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ requestId, reason }),
+            keepalive: true,
+        }).catch(() => { /* 취소 실패는 무시 */ });
+    }
+
+    /** 세션 전체 취소 (탭 닫힘 등, sendBeacon 사용) */
+    cancelSession(reason: string = 'page_hide'): void {
+        this.pending?.controller.abort();
+        this.pending = null;
+        navigator.sendBeacon(
+            API_CONFIG.CANCEL_ENDPOINT,
+            JSON.stringify({ sessionId: this.sessionId, reason }),
+        );
+    }
+
+    private async sendAnalyze(formData: FormData, requestId: string, signal: AbortSignal): Promise<AnalyzeResponse> {
         for (let attempt = 0; attempt < API_CONFIG.RETRY_COUNT; attempt++) {
             try {
                 const response = await fetch(API_CONFIG.ANALYZE_ENDPOINT, {
                     method: 'POST',
                     body: formData,
+                    headers: {
+                        'X-Request-Id': requestId,
+                        'X-Session-Id': this.sessionId,
+                    },
+                    signal,
                 });
 
                 const json = await response.json();
@@ -29,6 +78,12 @@ export class ApiClient {
 
                 return json as AnalyzeResponse;
             } catch (error) {
+                if (signal.aborted) {
+                    return {
+                        success: false,
+                        error: { code: 'CANCELLED', message: '요청이 취소되었습니다.' },
+                    };
+                }
                 console.warn(`[API] 요청 실패 (시도 ${attempt + 1}/${API_CONFIG.RETRY_COUNT}):`, error);
 
                 if (attempt < API_CONFIG.RETRY_COUNT - 1) {
@@ -0,0 +1,334 @@
+/* ============================================
+   Particle Shader Module
+   GPU 파티클 애니메이션 (Simplex Noise + Audio Reaction)
+   - 파티클별 데이터는 정적 attribute로 한 번만 업로드
+   - 감정/상태/오디오/시간은 uniform으로 매 프레임 전달 (CPU 작업은 파티클 수와 무관)
+   ============================================ */
+import * as THREE from 'three';
+import type { FaceParticleData } from './faceParticles';
+
+// ==========================================
+// GLSL Shaders
+// ==========================================
+
+export const PARTICLE_VERTEX_SHADER = `
+  uniform float uTime;
+  uniform float uAudioLow;
+  uniform float uAudioMid;
+  uniform float uAudioHigh;
+  uniform float uSpeedScale;   // 속도 배율
+  uniform float uNoiseAmp;     // 노이즈 강도
+  uniform float uExpand;       // 전체 확산 (말할 때)
+  uniform float uColorShift;   // 색상 변조 (생각할 때)
+  uniform float uAudioVolume;  // 전체 볼륨
+  uniform vec3 uEmotionColor;  // 감정 색상
+  uniform float uEmotionTint;  // 감정 색상 혼합 비율
+  
+  attribute float size;
+  attribute vec3 customColor;
+  attribute float aRandom;     // 파티클별 고정 난수 (0~1)
+  varying vec3 vColor;
+  varying float vDist;
+
+  // Simplex 3D Noise (축약)
+  vec3 mod289(vec3 x) { return x - floor(x * (1.0 / 289.0)) * 289.0; }
+  vec4 mod289(vec4 x) { return x - floor(x * (1.0 / 289.0)) * 289.0; }
+  vec4 permute(vec4 x) { return mod289(((x*34.0)+1.0)*x); }
+  vec4 taylorInvSqrt(vec4 r) { return 1.79284291400159 - 0.85373472095314 * r; }
+  float snoise(vec3 v) { 
+      const vec2 C = vec2(1.0/6.0, 1.0/3.0);
+      const vec4 D = vec4(0.0, 0.5, 1.0, 2.0);
+      vec3 i  = floor(v + dot(v, C.yyy));
+      vec3 x0 = v - i + dot(i, C.xxx);
+      vec3 g = step(x0.yzx, x0.xyz);
+      vec3 l = 1.0 - g;
+      vec3 i1 = min( g.xyz, l.zxy );
+      vec3 i2 = max( g.xyz, l.zxy );
+      vec3 x1 = x0 - i1 + C.xxx;
+      vec3 x2 = x0 - i2 + C.yyy;
+      vec3 x3 = x0 - D.yyy;
+      i = mod289(i);
+      vec4 p = permute( permute( permute( 
+                i.z + vec4(0.0, i1.z, i2.z, 1.0 ))
+              + i.y + vec4(0.0, i1.y, i2.y, 1.0 )) 
+              + i.x + vec4(0.0, i1.x, i2.x, 1.0 ));
+      float n_ = 0.142857142857;
+      vec3  ns = n_ * D.wyz - D.xzx;
+      vec4 j = p - 49.0 * floor(p * ns.z * ns.z);
+      vec4 x_ = floor(j * ns.z);
+      vec4 y_ = floor(j - 7.0 * x_ );
+      vec4 x = x_ *ns.x + ns.yyyy;
+      vec4 y = y_ *ns.x + ns.yyyy;
+      vec4 h = 1.0 - abs(x) - abs(y);
+      vec4 b0 = vec4( x.xy, y.xy );
+      vec4 b1 = vec4( x.zw, y.zw );
+      vec4 s0 = floor(b0)*2.0 + 1.0;
+      vec4 s1 = floor(b1)*2.0 + 1.0;
+      vec4 sh = -step(h, vec4(0.0));
+      vec4 a0 = b0.xzyw + s0.xzyw*sh.xxyy ;
+      vec4 a1 = b1.xzyw + s1.xzyw*sh.zzww ;
+      vec3 p0 = vec3(a0.xy,h.x);
+      vec3 p1 = vec3(a0.zw,h.y);
+      vec3 p2 = vec3(a1.xy,h.z);
+      vec3 p3 = vec3(a1.zw,h.w);
+      vec4 norm = taylorInvSqrt(vec4(dot(p0,p0), dot(p1,p1), dot(p2, p2), dot(p3,p3)));
+      p0 *= norm.x;
+      p1 *= norm.y;
+      p2 *= norm.z;
+      p3 *= norm.w;
+      vec4 m = max(0.6 - vec4(dot(x0,x0), dot(x1,x1), dot(x2,x2), dot(x3,x3)), 0.0);
+      m = m * m;
+      return 42.0 * dot( m*m, vec4( dot(p0,x0), dot(p1,x1), 
+                                    dot(p2,x2), dot(p3,x3) ) );
+  }
+
+  void main() {
+    vColor = mix(customColor, uEmotionColor, uEmotionTint);
+    vec3 pos = position;
+    
+    // 1. 기본 유동 (Flow)
+    float flow = snoise(pos * 0.05 + vec3(0.0, uTime * 0.3 * uSpeedScale, 0.0));
+    pos += vec3(flow) * (0.2 * uNoiseAmp);
+
+    // 2. 오디오 반응 (Speaking일 때 극대화)
+    float beat = uAudioLow * 2.5 * (1.0 + uExpand * 2.0); 
+    
+    // 말할 때 입 주변(Y축 중앙 하단)이나 전체적으로 튀어나오게
+    vec3 center = vec3(0.0, -5.0, 0.0); // 대략적인 얼굴 중심
+    vec3 dir = normalize(pos - center);
+    
+    // 말할 때(uExpand > 0) 확산 효과 강화
+    pos += dir * beat * (1.0 + uExpand * 3.0);
+    
+    // 고음 반응 (Thinking일 때 지지직거림)
+    float jitter = snoise(pos * 2.0 + uTime * 15.0) * uAudioHigh * (0.1 + uColorShift * 0.5);
+    pos.y += jitter;
+
+    // 3. Thinking 모드: 파티클이 위로 솟구치는 효과
+    if (uColorShift > 0.1) {
+        float thinkFlow = snoise(vec3(pos.x * 0.1, pos.y * 0.1 + uTime * 2.0, pos.z));
+        pos.y += thinkFlow * uColorShift * 2.0;
+    }
+
+    vec4 mvPosition = modelViewMatrix * vec4(pos, 1.0);
+    
+    // 거리에 따른 크기 조절
+    gl_PointSize = size * (300.0 / -mvPosition.z) * (1.0 + uAudioMid * 0.5 + uAudioVolume * 0.3 * aRandom);
+    gl_Position = projectionMatrix * mvPosition;
+    
+    // Thinking: 보라색/파란색 틴트
+    if (uColorShift > 0.0) {
+        vec3 thinkColor = vec3(0.2, 0.4, 1.0); // Electric Blue
+        vColor = mix(vColor, thinkColor, uColorShift * (0.5 + 0.5 * sin(uTime * 10.0)));
+    }
+    
+    // Speaking: 밝기 증가
+    vColor += vec3(uExpand * 0.3 * uAudioMid);
+    vDist = mvPosition.z;
+  }
+`;
+
+export const PARTICLE_FRAGMENT_SHADER = `
+  varying vec3 vColor;
+  
+  void main() {
+    // 부드러운 원형 파티클
+    float dist = length(gl_PointCoord - vec2(0.5));
+    if (dist > 0.5) discard;
+    
+    // 가장자리 페이드 아웃
+    float alpha = 1.0 - smoothstep(0.3, 0.5, dist);
+    
+    // 중심부 글로우
+    float glow = exp(-dist * 4.0) * 0.3;
+    
+    gl_FragColor = vec4(vColor + glow, alpha * 0.8);
+  }
+`;
+
+// ==========================================
+// CPU 참조 구현 (벤치마크 비교용)
+// PARTICLE_VERTEX_SHADER의 위치 변위와 같은 계산 - 쉐이더를 수정하면 함께 수정
+// ==========================================
+
+/** 위치 변위에 쓰이는 uniform 값 */
+export interface ParticleDisplacement {
+    time: number;
+    audioLow: number;
+    audioHigh: number;
+    speedScale: number;
+    noiseAmp: number;
+    expand: number;
+    colorShift: number;
+}
+
+const mod289 = (x: number) => x - Math.floor(x * (1.0 / 289.0)) * 289.0;
+const permute = (x: number) => mod289((x * 34.0 + 1.0) * x);
+
+/** GLSL snoise(vec3)의 스칼라 포팅 (Simplex 3D Noise) */
+export function snoise3(vx: number, vy: number, vz: number): number {
+    const s = (vx + vy + vz) / 3.0;
+    let ix = Math.floor(vx + s), iy = Math.floor(vy + s), iz = Math.floor(vz + s);
+    const t = (ix + iy + iz) / 6.0;
+    const x0 = vx - ix + t, y0 = vy - iy + t, z0 = vz - iz + t;
+
+    // 심플렉스 꼭짓점 순서 (g = step(x0.yzx, x0.xyz), l = 1 - g)
+    const gx = x0 >= y0 ? 1 : 0, gy = y0 >= z0 ? 1 : 0, gz = z0 >= x0 ? 1 : 0;
+    const lx = 1 - gx, ly = 1 - gy, lz = 1 - gz;
+    const offsets = [
+        [0, 0, 0],
+        [Math.min(gx, lz), Math.min(gy, lx), Math.min(gz, ly)],
+        [Math.max(gx, lz), Math.max(gy, lx), Math.max(gz, ly)],
+        [1, 1, 1],
+    ];
+
+    ix = mod289(ix); iy = mod289(iy); iz = mod289(iz);
+    // GPU(float32)와 같은 상수 사용 - float64의 0.142857142857은 1/7보다 작아 floor(7 * ns)가 0이 됨
+    const ns = Math.fround(0.142857142857);
+    let sum = 0;
+    for (let k = 0; k < 4; k++) {
+        const [ox, oy, oz] = offsets[k];
+        const cx = x0 - ox + k / 6.0, cy = y0 - oy + k / 6.0, cz = z0 - oz + k / 6.0;
+        const m = Math.max(0.6 - (cx * cx + cy * cy + cz * cz), 0.0);
+        if (m === 0) continue;
+
+        // 꼭짓점 해시 → 그래디언트
+        const p = permute(permute(permute(iz + oz) + iy + oy) + ix + ox);
+        const j = p - 49.0 * Math.floor(p * ns * ns);
+        const xi = Math.floor(j * ns);
+        const yi = Math.floor(j - 7.0 * xi);
+        const x = xi * 2.0 * ns + (0.5 * ns - 1.0);
+        const y = yi * 2.0 * ns + (0.5 * ns - 1.0);
+        const h = 1.0 - Math.abs(x) - Math.abs(y);
+        const sh = h <= 0.0 ? -1.0 : 0.0;
+        const px = x + (Math.floor(x) * 2.0 + 1.0) * sh;
+        const py = y + (Math.floor(y) * 2.0 + 1.0) * sh;
+        const pz = h;
+        const norm = 1.79284291400159 - 0.85373472095314 * (px * px + py * py + pz * pz);
+
+        const m2 = m * m;
+        sum += m2 * m2 * norm * (px * cx + py * cy + pz * cz);
+    }
+    return 42.0 * sum;
+}
+
+/** 쉐이더와 같은 위치 변위를 CPU에서 계산 (base → out, xyz 배열) */
+export function displaceParticlesCpu(base: Float32Array, out: Float32Array, u: ParticleDisplacement): void {
+    const beat = u.audioLow * 2.5 * (1.0 + u.expand * 2.0);
+    const push = beat * (1.0 + u.expand * 3.0);
+    const jitterAmp = u.audioHigh * (0.1 + u.colorShift * 0.5);
+    const flowY = u.time * 0.3 * u.speedScale;
+    const jitterT = u.time * 15.0;
+
+    for (let i = 0; i < base.length; i += 3) {
+        let x = base[i], y = base[i + 1], z = base[i + 2];
+
+        // 1. 기본 유동
+        const flow = snoise3(x * 0.05, y * 0.05 + flowY, z * 0.05) * (0.2 * u.noiseAmp);
+        x += flow; y += flow; z += flow;
+
+        // 2. 오디오 반응 (얼굴 중심 (0, -5, 0)에서 바깥 방향)
+        const dx = x, dy = y + 5.0, dz = z;
+        const len = Math.sqrt(dx * dx + dy * dy + dz * dz) || 1.0;
+        x += (dx / len) * push; y += (dy / len) * push; z += (dz / len) * push;
+
+        // 고음 반응
+        if (jitterAmp !== 0) {
+            y += snoise3(x * 2.0 + jitterT, y * 2.0 + jitterT, z * 2.0 + jitterT) * jitterAmp;
+        }
+
+        // 3. Thinking 모드
+        if (u.colorShift > 0.1) {
+            y += snoise3(x * 0.1, y * 0.1 + u.time * 2.0, z) * u.colorShift * 2.0;
+        }
+
+        out[i] = x; out[i + 1] = y; out[i + 2] = z;
+    }
+}
+
+export interface ParticleUniforms {
+    [uniform: string]: THREE.IUniform;
+    uTime: THREE.IUniform<number>;
+    uAudioLow: THREE.IUniform<number>;
+    uAudioMid: THREE.IUniform<number>;
+    uAudioHigh: THREE.IUniform<number>;
+    uAudioVolume: THREE.IUniform<number>;
+    uSpeedScale: THREE.IUniform<number>;
+    uNoiseAmp: THREE.IUniform<number>;
+    uExpand: THREE.IUniform<number>;
+    uColorShift: THREE.IUniform<number>;
+    uEmotionColor: THREE.IUniform<THREE.Color>;
+    uEmotionTint: THREE.IUniform<number>;
+}
+
+/** 파티클 쉐이더 머티리얼 생성 */
+export function createParticleMaterial(): THREE.ShaderMaterial & { uniforms: ParticleUniforms } {
+    const uniforms: ParticleUniforms = {
+        uTime: { value: 0 },
+        uAudioLow: { value: 0 },
+        uAudioMid: { value: 0 },
+        uAudioHigh: { value: 0 },
+        uAudioVolume: { value: 0 },
+        uSpeedScale: { value: 1.0 },
+        uNoiseAmp: { value: 1.0 },
+        uExpand: { value: 0.0 },
+        uColorShift: { value: 0.0 },
+        uEmotionColor: { value: new THREE.Color(0x00ffff) },
+        uEmotionTint: { value: 0.0 },
+    };
+
+    return new THREE.ShaderMaterial({
+        uniforms,
+        vertexShader: PARTICLE_VERTEX_SHADER,
+        fragmentShader: PARTICLE_FRAGMENT_SHADER,
+        transparent: true,
+        depthWrite: true,
+        blending: THREE.NormalBlending,
+    }) as THREE.ShaderMaterial & { uniforms: ParticleUniforms };
+}
+
+/**
+ * 파티클 지오메트리 생성 (정적 attribute, 한 번만 업로드)
+ * density > 1이면 각 파티클 주변에 복제본을 지터와 함께 배치하여 파티클 수를 늘림
+ */
+export function createParticleGeometry(data: FaceParticleData, density: number = 1, jitter: number = 0.3): THREE.BufferGeometry {
+    const copies = Math.max(1, Math.floor(density));
+    const count = data.count * copies;
+
+    const positions = new Float32Array(count * 3);
+    const colors = new Float32Array(count * 3);
+    const sizes = new Float32Array(count);
+    const randoms = new Float32Array(count);
+
+    for (let c = 0; c < copies; c++) {
+        const offset = c * data.count;
+        const spread = c === 0 ? 0 : jitter;
+        for (let i = 0; i < data.count; i++) {
+            const p = (offset + i) * 3;
+            positions[p] = data.positions[i * 3] + (Math.random() - 0.5) * spread;
+            positions[p + 1] = data.positions[i * 3 + 1] + (Math.random() - 0.5) * spread;
+            positions[p + 2] = data.positions[i * 3 + 2] + (Math.random() - 0.5) * spread;
+            colors[p] = data.colors[i * 3];
+            colors[p + 1] = data.colors[i * 3 + 1];
+            colors[p + 2] = data.colors[i * 3 + 2];
+            // 복제본은 살짝 작게 (밀도 증가 시 과포화 방지)
+            sizes[offset + i] = data.sizes[i] * (c === 0 ? 1 : 0.6);
+            randoms[offset + i] = Math.random();
+        }
+    }
+
+    const geometry = new THREE.BufferGeometry();
+    const attributes: [string, Float32Array, number][] = [
+        ['position', positions, 3],
+        ['customColor', colors, 3],
+        ['size', sizes, 1],
+        ['aRandom', randoms, 1],
+    ];
+    for (const [name, array, itemSize] of attributes) {
+        const attribute = new THREE.BufferAttribute(array, itemSize);
+        attribute.setUsage(THREE.StaticDrawUsage);
+        geometry.setAttribute(name, attribute);
+    }
+    geometry.computeBoundingSphere();
+    return geometry;
+}
@@ -1,6 +1,7 @@
 /* ============================================
    Visualizer Module
    Three.js 파티클 시스템 + 감정 반응 (Advanced Shader)
+   파티클별 애니메이션은 GPU(particleShader)에서 처리, 여기서는 uniform만 갱신
    ============================================ */
 import * as THREE from 'three';
 import { OrbitControls } from 'three/examples/jsm/controls/OrbitControls.js';
@@ -11,141 +12,7 @@ import { SCENE_CONFIG, PARTICLE_CONFIG, type AudioFrequencyData, type EmotionDat
 import { easeInOutCubic } from '../utils/lerp';
 import { FaceParticles, type FaceParticleData } from './faceParticles';
 import { getPreset, lerpPreset, type EmotionPreset } from './emotionPresets';
-
-// ==========================================
-// GLSL Shaders (Simplex Noise + Audio Reaction)
-// ==========================================
-
-const VERTEX_SHADER = `
-  uniform float uTime;
-  uniform float uAudioLow;
-  uniform float uAudioMid;
-  uniform float uAudioHigh;
-  uniform float uSpeedScale;   // 속도 배율
-  uniform float uNoiseAmp;     // 노이즈 강도
-  uniform float uExpand;       // 전체 확산 (말할 때)
-  uniform float uColorShift;   // 색상 변조 (생각할 때)
-  
-  attribute float size;
-  attribute vec3 customColor;
-  varying vec3 vColor;
-  varying float vDist;
-
-  // Simplex 3D Noise (축약)
-  vec3 mod289(vec3 x) { return x - floor(x * (1.0 / 289.0)) * 289.0; }
-  vec4 mod289(vec4 x) { return x - floor(x * (1.0 / 289.0)) * 289.0; }
-  vec4 permute(vec4 x) { return mod289(((x*34.0)+1.0)*x); }
-  vec4 taylorInvSqrt(vec4 r) { return 1.79284291400159 - 0.85373472095314 * r; }
-  float snoise(vec3 v) { 
-      const vec2 C = vec2(1.0/6.0, 1.0/3.0);
-      const vec4 D = vec4(0.0, 0.5, 1.0, 2.0);
-      vec3 i  = floor(v + dot(v, C.yyy));
-      vec3 x0 = v - i + dot(i, C.xxx);
-      vec3 g = step(x0.yzx, x0.xyz);
-      vec3 l = 1.0 - g;
-      vec3 i1 = min( g.xyz, l.zxy );
-      vec3 i2 = max( g.xyz, l.zxy );
-      vec3 x1 = x0 - i1 + C.xxx;
-      vec3 x2 = x0 - i2 + C.yyy;
-      vec3 x3 = x0 - D.yyy;
-      i = mod289(i);
-      vec4 p = permute( permute( permute( 
-                i.z + vec4(0.0, i1.z, i2.z, 1.0 ))
-              + i.y + vec4(0.0, i1.y, i2.y, 1.0 )) 
-              + i.x + vec4(0.0, i1.x, i2.x, 1.0 ));
-      float n_ = 0.142857142857;
-      vec3  ns = n_ * D.wyz - D.xzx;
-      vec4 j = p - 49.0 * floor(p * ns.z * ns.z);
-      vec4 x_ = floor(j * ns.z);
-      vec4 y_ = floor(j - 7.0 * x_ );
-      vec4 x = x_ *ns.x + ns.yyyy;
-      vec4 y = y_ *ns.x + ns.yyyy;
-      vec4 h = 1.0 - abs(x) - abs(y);
-      vec4 b0 = vec4( x.xy, y.xy );
-      vec4 b1 = vec4( x.zw, y.zw );
-      vec4 s0 = floor(b0)*2.0 + 1.0;
-      vec4 s1 = floor(b1)*2.0 + 1.0;
-      vec4 sh = -step(h, vec4(0.0));
-      vec4 a0 = b0.xzyw + s0.xzyw*sh.xxyy ;
-      vec4 a1 = b1.xzyw + s1.xzyw*sh.zzww ;
-      vec3 p0 = vec3(a0.xy,h.x);
-      vec3 p1 = vec3(a0.zw,h.y);
-      vec3 p2 = vec3(a1.xy,h.z);
-      vec3 p3 = vec3(a1.zw,h.w);
-      vec4 norm = taylorInvSqrt(vec4(dot(p0,p0), dot(p1,p1), dot(p2, p2), dot(p3,p3)));
-      p0 *= norm.x;
-      p1 *= norm.y;
-      p2 *= norm.z;
-      p3 *= norm.w;
-      vec4 m = max(0.6 - vec4(dot(x0,x0), dot(x1,x1), dot(x2,x2), dot(x3,x3)), 0.0);
-      m = m * m;
-      return 42.0 * dot( m*m, vec4( dot(p0,x0), dot(p1,x1), 
-                                    dot(p2,x2), dot(p3,x3) ) );
-  }
-
-  void main() {
-    vColor = customColor;
-    vec3 pos = position;
-    
-    // 1. 기본 유동 (Flow)
-    float flow = snoise(pos * 0.05 + vec3(0.0, uTime * 0.3 * uSpeedScale, 0.0));
-    pos += vec3(flow) * (0.2 * uNoiseAmp);
-
-    // 2. 오디오 반응 (Speaking일 때 극대화)
-    float beat = uAudioLow * 2.5 * (1.0 + uExpand * 2.0); 
-    
-    // 말할 때 입 주변(Y축 중앙 하단)이나 전체적으로 튀어나오게
-    vec3 center = vec3(0.0, -5.0, 0.0); // 대략적인 얼굴 중심
-    vec3 dir = normalize(pos - center);
-    
-    // 말할 때(uExpand > 0) 확산 효과 강화
-    pos += dir * beat * (1.0 + uExpand * 3.0);
-    
-    // 고음 반응 (Thinking일 때 지지직거림)
-    float jitter = snoise(pos * 2.0 + uTime * 15.0) * uAudioHigh * (0.1 + uColorShift * 0.5);
-    pos.y += jitter;
-
-    // 3. Thinking 모드: 파티클이 위로 솟구치는 효과
-    if (uColorShift > 0.1) {
-        float thinkFlow = snoise(vec3(pos.x * 0.1, pos.y * 0.1 + uTime * 2.0, pos.z));
-        pos.y += thinkFlow * uColorShift * 2.0;
-    }
-
-    vec4 mvPosition = modelViewMatrix * vec4(pos, 1.0);
-    
-    // 거리에 따른 크기 조절
-    gl_PointSize = size * (300.0 / -mvPosition.z) * (1.0 + uAudioMid * 0.5);
-    gl_Position = projectionMatrix * mvPosition;
-    
-    // Thinking: 보라색/파란색 틴트
-    if (uColorShift > 0.0) {
-        vec3 thinkColor = vec3(0.2, 0.4, 1.0); // Electric Blue
-        vColor = mix(vColor, thinkColor, uColorShift * (0.5 + 0.5 * sin(uTime * 10.0)));
-    }
-    
-    // Speaking: 밝기 증가
-    vColor += vec3(uExpand * 0.3 * uAudioMid);
-    vDist = mvPosition.z;
-  }
-`;
-
-const FRAGMENT_SHADER = `
-  varying vec3 vColor;
-  
-  void main() {
-    // 부드러운 원형 파티클
-    float dist = length(gl_PointCoord - vec2(0.5));
-    if (dist > 0.5) discard;
-    
-    // 가장자리 페이드 아웃
-    float alpha = 1.0 - smoothstep(0.3, 0.5, dist);
-    
-    // 중심부 글로우
-    float glow = exp(-dist * 4.0) * 0.3;
-    
-    gl_FragColor = vec4(vColor + glow, alpha * 0.8);
-  }
-`;
+import { createParticleGeometry, createParticleMaterial } from './particleShader';
 
 export class Visualizer {
     private scene!: THREE.Scene;
@@ -156,11 +23,12 @@ export class Visualizer {
     private bloomPass!: UnrealBloomPass;
     private particles!: THREE.Points;
     private geometry!: THREE.BufferGeometry;
-    private material!: THREE.ShaderMaterial;
+    private material!: ReturnType<typeof createParticleMaterial>;
 
     private faceData: FaceParticleData | null = null;
     private container!: HTMLElement;
     private clock = new THREE.Clock();
+    private phase = 0; // 누적 애니메이션 시간 (감정 속도 변화 시 튐 방지)
 
     // 감정 상태
     private currentPreset: EmotionPreset;
@@ -261,31 +129,13 @@ export class Visualizer {
     private createParticleSystem(): void {
         if (!this.faceData) return;
 
-        this.geometry = new THREE.BufferGeometry();
-        this.geometry.setAttribute('position', new THREE.BufferAttribute(this.faceData.positions, 3));
-        this.geometry.setAttribute('customColor', new THREE.BufferAttribute(this.faceData.colors, 3));
-        this.geometry.setAttribute('size', new THREE.BufferAttribute(this.faceData.sizes, 1));
-
-        // GLTF 모델용 머티리얼 설정
-        this.material = new THREE.ShaderMaterial({
-            uniforms: {
-                uTime: { value: 0 },
-                uAudioLow: { value: 0 },
-                uAudioMid: { value: 0 },
-                uAudioHigh: { value: 0 },
-                uSpeedScale: { value: 1.0 },
-                uNoiseAmp: { value: 1.0 },
-                uExpand: { value: 0.0 },
-                uColorShift: { value: 0.0 }
-            },
-            vertexShader: VERTEX_SHADER,
-            fragmentShader: FRAGMENT_SHADER,
-            transparent: true,
-            depthWrite: true,
-            blending: THREE.NormalBlending,
-        });
+        // 정적 attribute (한 번만 업로드)
+        this.geometry = createParticleGeometry(this.faceData, PARTICLE_CONFIG.DENSITY);
+        this.material = createParticleMaterial();
 
         this.particles = new THREE.Points(this.geometry, this.material);
+        // 쉐이더에서 위치가 변하므로 CPU 측 bounding sphere 기반 컬링 생략
+        this.particles.frustumCulled = false;
 
         // 모델이 너무 크거나 작으면 여기서 스케일 조정 (FaceParticles에서 이미 했지만 추가 보정)
         // this.particles.scale.set(0.1, 0.1, 0.1); 
@@ -296,7 +146,7 @@ export class Visualizer {
     update(audioData: AudioFrequencyData): void {
         if (!this.faceData || !this.material) return;
 
-        const time = this.clock.getElapsedTime();
+        const delta = Math.min(this.clock.getDelta(), 0.1);
 
         // 오디오 스무딩
         const smoothing = 0.15;
@@ -315,10 +165,15 @@ export class Visualizer {
         }
 
         // 쉐이더 Uniform 업데이트
-        this.material.uniforms.uTime.value = time * activePreset.speed;
-        this.material.uniforms.uAudioLow.value = this.audioInfluence.bass * activePreset.scale;
-        this.material.uniforms.uAudioMid.value = this.audioInfluence.mid;
-        this.material.uniforms.uAudioHigh.value = this.audioInfluence.treble;
+        this.phase += delta * activePreset.speed;
+        const uniforms = this.material.uniforms;
+        uniforms.uTime.value = this.phase;
+        uniforms.uAudioLow.value = this.audioInfluence.bass * activePreset.scale;
+        uniforms.uAudioMid.value = this.audioInfluence.mid;
+        uniforms.uAudioHigh.value = this.audioInfluence.treble;
+        uniforms.uAudioVolume.value = this.audioInfluence.volume;
+        uniforms.uEmotionColor.value.copy(activePreset.color);
+        uniforms.uEmotionTint.value = PARTICLE_CONFIG.EMOTION_TINT;
 
         // 상태별 목표값 설정
         const dt = 0.05;
@@ -354,10 +209,10 @@ export class Visualizer {
         this.stateUniforms.expand += (targetExpand - this.stateUniforms.expand) * dt;
         this.stateUniforms.colorShift += (targetColorShift - this.stateUniforms.colorShift) * dt;
 
-        this.material.uniforms.uSpeedScale.value = this.stateUniforms.speedScale;
-        this.material.uniforms.uNoiseAmp.value = this.stateUniforms.noiseAmp;
-        this.material.uniforms.uExpand.value = this.stateUniforms.expand;
-        this.material.uniforms.uColorShift.value = this.stateUniforms.colorShift;
+        uniforms.uSpeedScale.value = this.stateUniforms.speedScale;
+        uniforms.uNoiseAmp.value = this.stateUniforms.noiseAmp;
+        uniforms.uExpand.value = this.stateUniforms.expand;
+        uniforms.uColorShift.value = this.stateUniforms.colorShift;
 
         // Bloom 강도 (상태에 따라 변화)
         let bloomBoost = 1.0;
@@ -43,6 +43,9 @@ export const AUDIO_CONFIG = {
     BASS_RANGE: [0, 10],         // FFT bin 인덱스
     MID_RANGE: [10, 100],
     TREBLE_RANGE: [100, 512],
+    BARGE_IN_VOLUME: 0.15,       // 분석 대기 중 이 볼륨 이상 발화 시 끼어들기로 판단
+    BARGE_IN_HOLD: 300,          // ms, 끼어들기 판정 유지 시간
+    BARGE_IN_QUIET_GAP: 400,     // ms, 녹음 종료 후 이만큼 조용해야 끼어들기 감지 시작 (말 이어가는 중 취소 방지)
 };
 
 // Three.js 설정
@@ -68,6 +71,8 @@ export const PARTICLE_CONFIG = {
     DEPTH_SCALE: 0.03,           // Z축 깊이 스케일 (형상 납작하게)
     BASE_SIZE: 1.2,              // 기본 파티클 크기 (디테일 보존)
     NOISE_AMPLITUDE: 0.015,      // 노이즈 진폭 (은은하게)
+    DENSITY: 1,                  // 파티클 복제 배수 (GPU 애니메이션, 10 이상이면 10만 개 이상)
+    EMOTION_TINT: 0.25,          // 감정 색상 혼합 비율
     // 이미지 크롭 영역
     CROP_LEFT: 0.0,
     CROP_RIGHT: 1.0,
@@ -80,6 +85,7 @@ export const API_CONFIG = {
     BASE_URL: '/api',
     ANALYZE_ENDPOINT: '/api/analyze',
     HEALTH_ENDPOINT: '/api/health',
+    CANCEL_ENDPOINT: '/api/analyze/cancel',
     RETRY_COUNT: 3,
     RETRY_DELAY: 1000,           // ms
 };
@@ -120,5 +126,6 @@ export interface AnalyzeResponse {
         code: string;
         message: string;
     };
+    requestId?: string;
     processing_time?: number;
 }
@@ -13,5 +13,11 @@ export default defineConfig({
   build: {
     outDir: 'dist',
     sourcemap: true,
+    rollupOptions: {
+      input: {
+        main: 'index.html',
+        bench: 'bench.html',   // 파티클 FPS 벤치마크
+      },
+    },
   },
 });
@@ -9,6 +9,8 @@ sys.path.append(os.path.join(os.getcwd(), 'backend'))
 from backend.config import Config
 from backend.services.ollama_service import OllamaService
 from backend.services.tts_service import TtsService
+# TtsService와 같은 모듈 인스턴스를 써야 저장소를 공유함
+from services.audio_store import AudioStore
 
 # 로깅 설정
 import logging
@@ -44,18 +46,14 @@ def test_pipeline():
     print("Generating TTS Audio...")
     
     try:
-        # temp_audio 폴더 확보
-        os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
+        audio_id = TtsService.start_audio(ai_response)
+        print(f"[TTS Audio Id] {audio_id}")
         
-        filename = TtsService.generate_audio(ai_response)
-        print(f"[TTS Filename] {filename}")
-        
-        filepath = os.path.join(Config.UPLOAD_FOLDER, filename)
-        if filename and os.path.exists(filepath):
-            file_size = os.path.getsize(filepath)
-            print(f"[Success] Audio file created at {filepath} ({file_size} bytes)")
+        if audio_id and AudioStore.wait(audio_id, Config.TTS_STREAM_TIMEOUT):
+            audio_size = len(AudioStore.get(audio_id).data())
+            print(f"[Success] Audio created in memory store ({audio_size} bytes)")
         else:
-            print("[Fail] Audio file creation failed")
+            print("[Fail] Audio creation failed")
 
     except Exception as e:
         print(f"[Error] TTS failed: {e}")